@@ -43,6 +43,17 @@ class Genji(commands.Bot):
     _xp_manager: XPService
     _thumbnail_service: VideoThumbnailService
 
+    # Bot attributes holding services that may define RabbitMQ queue consumers.
+    service_attrs: tuple[str, ...] = (
+        "notifications",
+        "playtest",
+        "newsfeed",
+        "api",
+        "completions",
+        "xp",
+        "thumbnail_service",
+    )
+
     def __init__(self, *, prefix: str, session: aiohttp.ClientSession) -> None:
         """Initialize Bot instance.
 
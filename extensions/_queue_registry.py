@@ -32,6 +32,7 @@ def queue_consumer(
     struct_type: Type[TStruct],
     idempotent: bool = False,
     pytest_header: str = "x-pytest-enabled",
+    prefetch_count: int = 1,
 ) -> Callable[[F], F]:
     """Decorator for defining RabbitMQ consumer handlers.
 
@@ -46,7 +47,8 @@ def queue_consumer(
     The wrapper performs these steps:
 
     1. Checks for a pytest header and skips processing when present.
-    2. Decodes the incoming message body into the specified ``struct_type`` using ``msgspec``.
+    2. Decodes the incoming message body into the specified ``struct_type`` using a ``msgspec``
+       decoder built once per handler.
     3. If ``idempotent`` is enabled:
        - Claims idempotency using ``bot.api.claim_idempotency``.
        - Skips processing when the message has already been consumed.
@@ -54,7 +56,7 @@ def queue_consumer(
     4. Calls the original handler with ``(self, event, message)``.
 
     Metadata is attached to the wrapper for later inspection by
-    ``RabbitService`` (``_queue_name``, ``_struct_type``, ``_idempotent``).
+    ``RabbitService`` (``_queue_name``, ``_struct_type``, ``_idempotent``, ``_prefetch_count``).
 
     Args:
         queue_name (str):
@@ -68,6 +70,9 @@ def queue_consumer(
         pytest_header (str, optional):
             The message header that, when truthy, causes the consumer
             to no-op (useful for integration tests). Defaults to ``"x-pytest-enabled"``.
+        prefetch_count (int, optional):
+            How many unacknowledged messages RabbitMQ may deliver to this consumer at once.
+            Handlers run concurrently up to this limit. Defaults to ``1``.
 
     Returns:
         Callable[[F], F]:
@@ -83,6 +88,8 @@ def queue_consumer(
     """
 
     def decorator(fn: F) -> F:
+        decoder = msgspec.json.Decoder(struct_type)
+
         async def wrapper(self: object, message: AbstractIncomingMessage) -> None:
             headers = message.headers or {}
 
@@ -93,7 +100,7 @@ def queue_consumer(
                 )
                 return
 
-            event = msgspec.json.decode(message.body, type=struct_type)
+            event = decoder.decode(message.body)
 
             if not idempotent:
                 await fn(self, event, message)
@@ -130,6 +137,7 @@ def queue_consumer(
         setattr(wrapper, "_queue_name", queue_name)
         setattr(wrapper, "_struct_type", struct_type)
         setattr(wrapper, "_idempotent", idempotent)
+        setattr(wrapper, "_prefetch_count", prefetch_count)
 
         wrapper.__name__ = fn.__name__
         wrapper.__doc__ = fn.__doc__
@@ -94,6 +94,7 @@ from genjipk_sdk.xp import TierChangeResponse, XpGrantRequest, XpGrantResponse
 from multidict import MultiDict
 
 from extensions.completions import CompletionLeaderboardFormattable, CompletionUserFormattable
+from utilities.cache import TTLCache
 from utilities.change_requests import FormattableChangeRequest, FormattableStaleChangeRequest
 from utilities.completions import CompletionSubmissionModel, SuspiciousCompletionModel
 from utilities.errors import APIHTTPError, APIUnavailableError
@@ -122,6 +123,16 @@ PlaytestFilter = Literal["All", "Only", "None"]
 OfficialFilter = Literal["All", "Official Only", "Unofficial (CN) Only"]
 
 
+# Seconds a user's notification flags or Overwatch usernames are served from memory.
+USER_SETTINGS_CACHE_TTL = 30.0
+# Most users whose notification flags or Overwatch usernames are kept in memory at once.
+USER_SETTINGS_CACHE_SIZE = 1024
+
+# Keep API sockets warm between calls; tag lookups and autocomplete are small, latency-bound requests.
+API_KEEPALIVE_TIMEOUT = 60.0
+API_CONNECTIONS_PER_HOST = 32
+
+
 @lru_cache(maxsize=None)
 def get_decoder(model: type[D]) -> msgspec.json.Decoder[D]:
     """Return a cached msgspec decoder for the given model type.
@@ -161,10 +172,23 @@ class APIService:
         """Initialize the APIService with authentication and heartbeat logic."""
         self.api_key: str = os.getenv("API_KEY", "")
         self._encoder = msgspec.json.Encoder(decimal_format="number")
-        self.__session: aiohttp.ClientSession = aiohttp.ClientSession(headers={"X-API-KEY": self.api_key})
+        self._json_headers = {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
+        connector = aiohttp.TCPConnector(
+            limit_per_host=API_CONNECTIONS_PER_HOST,
+            keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+        )
+        self.__session: aiohttp.ClientSession = aiohttp.ClientSession(
+            connector=connector, headers={"X-API-KEY": self.api_key}
+        )
         self._is_available = False
         self._lock = asyncio.Lock()
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self._notification_flags_cache: TTLCache[int, Notification] = TTLCache(
+            USER_SETTINGS_CACHE_SIZE, USER_SETTINGS_CACHE_TTL
+        )
+        self._overwatch_usernames_cache: TTLCache[int, OverwatchUsernamesResponse] = TTLCache(
+            USER_SETTINGS_CACHE_SIZE, USER_SETTINGS_CACHE_TTL
+        )
 
     async def _heartbeat_loop(self) -> None:
         """Continuously ping the API to determine availability and update internal state."""
@@ -313,10 +337,7 @@ class APIService:
             ValueError: If no content is returned but a model was expected.
         """
         await self._ensure_available()
-        headers = {
-            "X-API-KEY": self.api_key,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
 
         if data is not None:
             kwargs["data"] = self._encoder.encode(data)
@@ -898,27 +919,35 @@ class APIService:
         params = {"search": search, "limit": limit, "fake_users_only": fake_users_only}
         return self._request(r, params=params, response_model=list[tuple[int, str]] | None)
 
-    async def get_notification_flags(self, user_id: int, *, to_bitmask: bool = True) -> Notification:
+    async def get_notification_flags(
+        self, user_id: int, *, to_bitmask: bool = True, use_cache: bool = True
+    ) -> Notification:
         """Retrieve notification settings for a user.
 
         Args:
             user_id (int): The ID of the user.
             to_bitmask (bool, optional): Whether to return as a bitmask. Defaults to True.
+            use_cache (bool, optional): Whether a recently fetched value may be returned. Defaults to True.
 
         Returns:
             Notification: The parsed notification flags.
         """
+        cached = self._notification_flags_cache.get(user_id) if use_cache else None
+        if cached is not None:
+            return cached
         r = Route("GET", "/users/{user_id}/notifications", user_id=user_id)
         data = await self._request(r, params={"to_bitmask": str(to_bitmask)})
         decoded = msgspec.json.decode(data)
         if to_bitmask:
             bitmask = decoded.get("bitmask")
-            return Notification(bitmask or 0)
-        notifications = decoded.get("notifications")
-        flags = sum((Notification[name] for name in notifications), Notification(0))
+            flags = Notification(bitmask or 0)
+        else:
+            notifications = decoded.get("notifications")
+            flags = sum((Notification[name] for name in notifications), Notification(0))
+        self._notification_flags_cache.set(user_id, flags)
         return flags
 
-    def update_notification(self, user_id: int, notification_type: NOTIFICATION_TYPES, data: bool) -> Response[None]:
+    async def update_notification(self, user_id: int, notification_type: NOTIFICATION_TYPES, data: bool) -> None:
         """Update a user's notification preference.
 
         Args:
@@ -926,8 +955,6 @@ class APIService:
             notification_type: The type of notification to update.
             data: Whether the notification should be enabled (True) or disabled (False).
 
-        Returns:
-            Response[None]: API response object.
         """
         r = Route(
             "PATCH",
@@ -935,7 +962,8 @@ class APIService:
             user_id=user_id,
             notification_type=notification_type,
         )
-        return self._request(r, data=data)  # pyright: ignore[reportArgumentType]
+        await self._request(r, data=data)  # pyright: ignore[reportArgumentType]
+        self._notification_flags_cache.pop(user_id)
 
     def check_user_is_creator(self, user_id: int) -> Response[bool]:
         """Check if user is a creator.
@@ -1389,30 +1417,33 @@ class APIService:
         r = Route("PATCH", "/change-requests/{thread_id}/alerted", thread_id=thread_id)
         return self._request(r)
 
-    def get_overwatch_usernames(self, user_id: int) -> Response[OverwatchUsernamesResponse]:
+    async def get_overwatch_usernames(self, user_id: int) -> OverwatchUsernamesResponse:
         """Fetch Overwatch usernames associated with a user.
 
         Args:
             user_id: ID of the target user.
 
         Returns:
-            Response[OverwatchUsernamesResponse]: Usernames DTO for the user.
+            OverwatchUsernamesResponse: Usernames DTO for the user.
         """
+        cached = self._overwatch_usernames_cache.get(user_id)
+        if cached is not None:
+            return cached
         r = Route("GET", "/users/{user_id}/overwatch", user_id=user_id)
-        return self._request(r, response_model=OverwatchUsernamesResponse)
+        usernames = await self._request(r, response_model=OverwatchUsernamesResponse)
+        self._overwatch_usernames_cache.set(user_id, usernames)
+        return usernames
 
-    def update_overwatch_usernames(self, user_id: int, data: OverwatchUsernamesUpdateRequest) -> Response[None]:
+    async def update_overwatch_usernames(self, user_id: int, data: OverwatchUsernamesUpdateRequest) -> None:
         """Update Overwatch usernames for a user.
 
         Args:
             user_id: ID of the target user.
             data: Update payload for Overwatch usernames.
-
-        Returns:
-            Response[None]: API response object.
         """
         r = Route("PUT", "/users/{user_id}/overwatch", user_id=user_id)
-        return self._request(r, data=data)
+        await self._request(r, data=data)
+        self._overwatch_usernames_cache.pop(user_id)
 
     def convert_map_to_legacy(self, code: OverwatchCode) -> Response[None]:
         """Convert a map to legacy status.
@@ -29,7 +29,8 @@ class NotificationService:
 
     async def should_notify(self, user_id: int, notification: Notification) -> bool:
         """Check if a user has allowed notifications for this particular process."""
-        flags = await self.bot.api.get_notification_flags(user_id)
+        # Read through to the API so an opt-out made elsewhere (e.g. on the website) is honoured immediately.
+        flags = await self.bot.api.get_notification_flags(user_id, use_cache=False)
         # Bitwise AND: returns non-zero if the notification flag is enabled.
         result = bool(flags & notification)
         logger.debug("User %s: Checking %s: %s", user_id, notification.name, result)
@@ -4,18 +4,20 @@ import asyncio
 import os
 import time
 from logging import getLogger
-from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Iterator
 
 from aio_pika import Channel, DeliveryMode, Message, connect_robust
 from aio_pika.abc import AbstractIncomingMessage
 from aio_pika.exceptions import QueueEmpty
 from aio_pika.pool import Pool
+from aiormq import spec
 from discord import TextChannel
 
 from extensions._queue_registry import QueueHandler
 
 if TYPE_CHECKING:
     from aio_pika.abc import AbstractRobustConnection
+    from aiormq.abc import AbstractChannel
 
     import core
 
@@ -24,14 +26,16 @@ log = getLogger(__name__)
 RABBITMQ_USER = os.getenv("RABBITMQ_DEFAULT_USER", "")
 RABBITMQ_PASS = os.getenv("RABBITMQ_DEFAULT_PASS", "")
 RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "")
+CONN_POOL_SIZE = int(os.getenv("RABBIT_CONN_POOL", "2"))
+CHANNEL_POOL_SIZE = int(os.getenv("RABBIT_CHANNEL_POOL", "32"))
 
 # DLQ processor config (no edits to existing constants)
 DLQ_HEADER_KEY = os.getenv("DLQ_HEADER_KEY", "dlq_notified")
 DLQ_PROCESS_INTERVAL = int(os.getenv("DLQ_PROCESS_INTERVAL", "60"))  # seconds between scans
 DLQ_MAX_PER_QUEUE_TICK = int(os.getenv("DLQ_MAX_PER_QUEUE_TICK", "5000"))  # safety cap per scan
-
-
-F = TypeVar("F", bound=Callable[..., Awaitable[None]])
+DLQ_MAX_PROCESS_INTERVAL = int(os.getenv("DLQ_MAX_PROCESS_INTERVAL", "600"))  # idle back-off ceiling
+DLQ_ALERT_MAX_LENGTH = 2000  # Discord message content limit
+DLQ_ALERT_BODY_PREVIEW = 1800  # characters of each message body included in an alert
 
 
 class RabbitService:
@@ -45,20 +49,25 @@ class RabbitService:
         startup synchronization primitives, and schedules the initial queue setup task.
         """
         self.bot = bot
-        self._connection_pool = Pool(self._get_connection, max_size=2)
-        self._channel_pool = Pool(self._get_channel, max_size=10)
+        self._amqp_url = f"amqp://{RABBITMQ_USER}:{RABBITMQ_PASS}@{RABBITMQ_HOST}/"
+        self._connection_pool = Pool(self._get_connection, max_size=CONN_POOL_SIZE)
+        self._channel_pool = Pool(self._get_channel, max_size=CHANNEL_POOL_SIZE)
         self._startup_drain_complete = asyncio.Event()
         self._startup_draining = True
         self._pending_startup_messages = 0
 
         self._queues: dict[str, QueueHandler] = {}
+        self._prefetch_counts: dict[str, int] = {}
         self._dlq_suffix = ".dlq"
+        self._dlq_names: dict[str, str] = {}
 
         self._setup_task: asyncio.Task | None = None
+        self._dlq_sweep_delay = DLQ_PROCESS_INTERVAL
 
     def start(self) -> None:
         """Start the RabbitMQ client by launching queue setup in the background."""
         self._queues = self._collect_queue_handlers()
+        self._dlq_names = {q: q + self._dlq_suffix for q in self._queues}
         log.debug("[Rabbit] Queues to consume (resolved): %s", list(self._queues.keys()))
         self._setup_task = asyncio.create_task(self._set_up_queues())
         log.debug("[DLQ] Will scan: %s", self.list_target_dlqs())
@@ -80,20 +89,21 @@ class RabbitService:
         await self.bot.wait_until_ready()
         log.debug(f"[→] Queues to consume: {list(self._queues.keys())}")
         for queue_name, handler in self._queues.items():
+            dlq_name = self._dlq_names[queue_name]
             log.debug(f"[x] Declaring queue: {queue_name}")
             channel = await self._get_channel()
-            await channel.set_qos(prefetch_count=1)
+            await channel.set_qos(prefetch_count=self._prefetch_counts.get(queue_name, 1))
 
             queue = await channel.declare_queue(
                 queue_name,
                 durable=True,
                 arguments={
                     "x-dead-letter-exchange": "",
-                    "x-dead-letter-routing-key": queue_name + self._dlq_suffix,
+                    "x-dead-letter-routing-key": dlq_name,
                 },
             )
 
-            await channel.declare_queue(queue_name + self._dlq_suffix, durable=True)
+            await channel.declare_queue(dlq_name, durable=True)
 
             declared = await channel.declare_queue(queue_name, passive=True)
             self._pending_startup_messages += declared.declaration_result.message_count or 0
@@ -103,7 +113,7 @@ class RabbitService:
             )
 
             log.debug(f"[⏳] Declaring and consuming queue: {queue_name}")
-            await queue.consume(await self._wrap_handler(handler, queue_name))
+            await queue.consume(self._wrap_handler(handler, queue_name))
 
         if self._pending_startup_messages == 0:
             self._startup_draining = False
@@ -112,7 +122,7 @@ class RabbitService:
 
     async def _get_connection(self) -> AbstractRobustConnection:
         try:
-            return await connect_robust(f"amqp://{RABBITMQ_USER}:{RABBITMQ_PASS}@{RABBITMQ_HOST}/")
+            return await connect_robust(self._amqp_url, client_properties={"connection_name": "genji-bot"})
         except Exception as e:
             log.error(f"[!] [RabbitMQ] Error connecting get_connection: {e}")
             raise
@@ -140,57 +150,68 @@ class RabbitService:
             await channel.default_exchange.publish(message, routing_key=queue_name)
             log.debug(f"[→] Published message to {queue_name}")
 
+    def _iter_handler_owners(self) -> Iterator[Any]:
+        """Yield the cogs and bot-attached services that may own queue handlers."""
+        yield from self.bot.cogs.values()
+        for attr_name in self.bot.service_attrs:
+            instance = getattr(self.bot, attr_name, None)
+            if instance is not None:
+                yield instance
+
     def _collect_queue_handlers(self) -> dict[str, QueueHandler]:
         """Discover all queue handlers on bot-attached services.
 
-        Looks for methods tagged with `_queue_name` by @queue_consumer.
-        Applies `_wrap_job_status` if present on the owning instance.
+        Looks for methods tagged with `_queue_name` by @queue_consumer and records
+        each queue's `_prefetch_count`. Applies `_wrap_job_status` if present on the
+        owning instance.
+
+        Only class namespaces are scanned, so instance properties are never evaluated.
         """
         queues: dict[str, QueueHandler] = {}
 
-        for attr_name in dir(self.bot):
-            instance = getattr(self.bot, attr_name, None)
-            if instance is None:
-                continue
-
-            for meth_name in dir(instance):
-                candidate = getattr(instance, meth_name)
-                if not callable(candidate):
-                    continue
-
-                func = getattr(candidate, "__func__", candidate)
-                queue_name = getattr(func, "_queue_name", None)
-                if not queue_name:
-                    continue
-
-                # Apply job-status wrapper if available
-                if hasattr(instance, "_wrap_job_status"):
-                    handler: QueueHandler = instance._wrap_job_status(candidate)  # noqa: SLF001
-                else:
-                    handler = candidate  # pyright: ignore[reportAssignmentType]
-
-                if queue_name in queues:
-                    log.warning(
-                        "Duplicate handler for queue %s: existing=%r, new=%s.%s; keeping existing.",
+        for instance in self._iter_handler_owners():
+            seen: set[str] = set()
+            for klass in type(instance).__mro__:
+                for meth_name, func in vars(klass).items():
+                    if meth_name in seen:
+                        continue
+                    seen.add(meth_name)
+
+                    queue_name = getattr(func, "_queue_name", None)
+                    if not queue_name:
+                        continue
+
+                    candidate = getattr(instance, meth_name)
+
+                    # Apply job-status wrapper if available
+                    if hasattr(instance, "_wrap_job_status"):
+                        handler: QueueHandler = instance._wrap_job_status(candidate)  # noqa: SLF001
+                    else:
+                        handler = candidate
+
+                    if queue_name in queues:
+                        log.warning(
+                            "Duplicate handler for queue %s: existing=%r, new=%s.%s; keeping existing.",
+                            queue_name,
+                            queues[queue_name],
+                            type(instance).__name__,
+                            meth_name,
+                        )
+                        continue
+
+                    queues[queue_name] = handler
+                    self._prefetch_counts[queue_name] = getattr(func, "_prefetch_count", 1)
+                    log.debug(
+                        "[Rabbit] Registered handler %s -> %s.%s",
                         queue_name,
-                        queues[queue_name],
                         type(instance).__name__,
                         meth_name,
                     )
-                    continue
-
-                queues[queue_name] = handler
-                log.debug(
-                    "[Rabbit] Registered handler %s -> %s.%s",
-                    queue_name,
-                    type(instance).__name__,
-                    meth_name,
-                )
 
         log.debug("[Rabbit] Queues resolved (discovered): %s", list(queues.keys()))
         return queues
 
-    async def _wrap_handler(self, handler: QueueHandler, queue_name: str) -> QueueHandler:
+    def _wrap_handler(self, handler: QueueHandler, queue_name: str) -> QueueHandler:
         """Wrap a queue handler to manage errors and startup drain accounting.
 
         Args:
@@ -206,29 +227,28 @@ class RabbitService:
             try:
                 async with message.process():
                     await handler(message)
-
                     if self._startup_draining:
-                        self._pending_startup_messages -= 1
-                        if self._pending_startup_messages <= 0:
-                            log.debug("[✓] Startup drain complete.")
-                            self._startup_draining = False
-                            self._startup_drain_complete.set()
-
+                        self._record_startup_message()
             except Exception:
                 log.exception(f"[!] Error processing message from {queue_name}, publishing to DLQ.")
 
         return wrapped
 
+    def _record_startup_message(self) -> None:
+        """Count one drained startup message and signal completion once none remain."""
+        self._pending_startup_messages = pending = self._pending_startup_messages - 1
+        if pending <= 0:
+            log.debug("[✓] Startup drain complete.")
+            self._startup_draining = False
+            self._startup_drain_complete.set()
+
     async def wait_until_drained(self) -> None:
         """Block until all startup messages have been processed and draining is complete.
 
         This method is typically used to defer downstream operations until all
         early messages are handled and the client is ready for steady-state operation.
         """
-        try:
-            await asyncio.wait_for(self._startup_drain_complete.wait(), timeout=None)
-        except asyncio.TimeoutError:
-            log.debug("[!] Startup drain timed out. Continuing anyway.")
+        await self._startup_drain_complete.wait()
 
     def start_dlq_processor(self) -> None:
         """Start a background task that periodically processes all DLQs.
@@ -241,45 +261,61 @@ class RabbitService:
             log.debug("[→] DLQ processor started.")
 
     async def _dlq_processor_loop(self) -> None:
-        """Periodic DLQ sweep loop."""
+        """Periodic DLQ sweep loop.
+
+        Sweeps that find nothing new back off exponentially up to DLQ_MAX_PROCESS_INTERVAL,
+        while a sweep that hit the per-queue cap is followed immediately by another.
+        """
         await self.bot.wait_until_ready()
         while True:
+            saturated = False
             try:
-                processed = await self._process_all_dlqs_once()
+                processed, notified, saturated = await self._process_all_dlqs_once()
                 if processed:
                     log.debug(f"[DLQ] processed {processed} message(s) across all DLQs")
+                self._dlq_sweep_delay = (
+                    DLQ_PROCESS_INTERVAL if notified else min(self._dlq_sweep_delay * 2, DLQ_MAX_PROCESS_INTERVAL)
+                )
             except Exception:
                 log.exception("[DLQ] Unhandled error during DLQ processing loop")
-            await asyncio.sleep(DLQ_PROCESS_INTERVAL)
+            if saturated:
+                continue
+            await asyncio.sleep(self._dlq_sweep_delay)
 
-    async def _process_all_dlqs_once(self) -> int:
+    async def _process_all_dlqs_once(self) -> tuple[int, int, bool]:
         """Process each registered queue's DLQ once with a fixed cap per queue.
 
         Returns:
-            int: Total number of DLQ messages processed in this sweep.
+            tuple[int, int, bool]: Total number of DLQ messages processed in this sweep, how many of
+                those were newly notified, and whether any queue hit DLQ_MAX_PER_QUEUE_TICK with
+                new messages still arriving.
         """
         total = 0
+        total_notified = 0
+        saturated = False
         # Use a single channel for the sweep; it's fine for moderate volumes.
         async with self._channel_pool.acquire() as channel:
             await channel.set_qos(prefetch_count=100)
             for base_queue in self._queues:
                 try:
-                    n = await self._process_one_dlq(channel, base_queue)
+                    n, notified = await self._process_one_dlq(channel, base_queue)
                     total += n
+                    total_notified += notified
+                    saturated = saturated or (notified > 0 and n >= DLQ_MAX_PER_QUEUE_TICK)
                 except Exception:
                     log.exception(f"[DLQ] Error processing DLQ for base queue '{base_queue}'")
-        return total
+        return total, total_notified, saturated
 
-    async def _process_one_dlq(self, channel: Channel, base_queue: str) -> int:
+    async def _process_one_dlq(self, channel: Channel, base_queue: str) -> tuple[int, int]:
         """Republish at most <snapshot depth> messages from <base_queue>.dlq with a header.
 
         The 'snapshot depth' is taken at the start (message_count). We process up to that number,
         so the scan won't loop forever even as republished messages return to the DLQ.
 
         Returns:
-            int: Number processed for this DLQ.
+            tuple[int, int]: Number processed for this DLQ, and how many of those were newly notified.
         """
-        dlq_name = f"{base_queue}{self._dlq_suffix}"
+        dlq_name = self._dlq_names[base_queue]
 
         # Passive declare to get initial count without creating it.
         dlq = await channel.declare_queue(dlq_name, passive=True)
@@ -287,16 +323,22 @@ class RabbitService:
         initial_count = dlq.declaration_result.message_count or 0
         cap = min(initial_count, DLQ_MAX_PER_QUEUE_TICK)
         if cap == 0:
-            return 0
+            return 0, 0
+
+        alert_header = f"### {dlq_name}\n<@141372217677053952>"
+        batch: list[AbstractIncomingMessage] = []
+        fragments: list[str] = []
+        alert_len = len(alert_header)
+
+        amqp_channel = await channel.get_underlay_channel()
 
         processed = 0
-        # We re-declare a queue object to use .get() (dlq above is fine too; either works).
-        queue = await channel.declare_queue(dlq_name, passive=True)
+        notified = 0
 
-        while processed < cap:
+        while processed + len(batch) < cap:
             # Try non-blocking get with a tiny timeout to avoid hanging.
             try:
-                msg = await queue.get(timeout=0.1, no_ack=False)
+                msg = await dlq.get(timeout=0.1, no_ack=False)
             except asyncio.TimeoutError:
                 break
             except QueueEmpty:
@@ -311,18 +353,62 @@ class RabbitService:
                 processed += 1
                 continue
 
-            guild = self.bot.get_guild(self.bot.config.guild)
-            if not guild:
-                raise RuntimeError("Why is there no guild")
-            content = f"### {dlq_name}\n<@141372217677053952>\n```json\n{msg.body}```"
-            alert_channel = guild.get_channel(self.bot.config.channels.updates.dlq_alerts)
-            assert isinstance(alert_channel, TextChannel)
-            await alert_channel.send(content)
+            # Alerts are batched into as few Discord messages as fit the content limit.
+            fragment = f"```json\n{msg.body.decode(errors='replace')[:DLQ_ALERT_BODY_PREVIEW]}```"
+            if batch and alert_len + len(fragment) + 1 > DLQ_ALERT_MAX_LENGTH:
+                await self._notify_dlq_batch(amqp_channel, dlq_name, "\n".join([alert_header, *fragments]), batch)
+                processed += len(batch)
+                notified += len(batch)
+                batch.clear()
+                fragments.clear()
+                alert_len = len(alert_header)
+            batch.append(msg)
+            fragments.append(fragment)
+            alert_len += len(fragment) + 1
+
+        if batch:
+            await self._notify_dlq_batch(amqp_channel, dlq_name, "\n".join([alert_header, *fragments]), batch)
+            processed += len(batch)
+            notified += len(batch)
+
+        if processed:
+            log.debug(f"[DLQ] {dlq_name}: processed {processed}/{cap} (snapshot={initial_count})")
+        return processed, notified
+
+    def _get_dlq_alert_channel(self) -> TextChannel:
+        """Return the configured DLQ alert channel."""
+        guild = self.bot.get_guild(self.bot.config.guild)
+        if not guild:
+            raise RuntimeError("Why is there no guild")
+        alert_channel = guild.get_channel(self.bot.config.channels.updates.dlq_alerts)
+        assert isinstance(alert_channel, TextChannel)
+        return alert_channel
+
+    async def _notify_dlq_batch(
+        self, amqp_channel: AbstractChannel, dlq_name: str, alert: str, batch: list[AbstractIncomingMessage]
+    ) -> None:
+        """Send one alert for a batch of DLQ messages, then republish each with the notified header.
+
+        The alert is awaited before anything is marked notified. If it fails, the batch is
+        requeued unmarked so the next sweep alerts it again.
 
+        Args:
+            amqp_channel (AbstractChannel): The raw channel used to republish.
+            dlq_name (str): The DLQ the messages were taken from.
+            alert (str): The alert message content covering the whole batch.
+            batch (list[AbstractIncomingMessage]): The unacked messages the alert covers.
+        """
+        try:
+            await self._get_dlq_alert_channel().send(alert)
+        except Exception:
+            for msg in batch:
+                await msg.nack(requeue=True)
+            raise
+
+        for msg in batch:
             # Republish a *copy* with the header set, then ack the original.
-            new_headers = {**headers, DLQ_HEADER_KEY: True, "dlq_notified_at": int(time.time())}
-            repub = Message(
-                body=msg.body,
+            new_headers = {**(msg.headers or {}), DLQ_HEADER_KEY: True, "dlq_notified_at": int(time.time())}
+            properties = spec.Basic.Properties(
                 headers=new_headers,
                 content_type=msg.content_type,
                 content_encoding=msg.content_encoding,
@@ -330,23 +416,19 @@ class RabbitService:
                 correlation_id=msg.correlation_id,
                 message_id=msg.message_id,
                 timestamp=msg.timestamp,
-                type=msg.type,
+                message_type=msg.type,
                 app_id=msg.app_id,
                 user_id=msg.user_id,
             )
 
-            # Publish right back to the DLQ by name via the default exchange.
-            await channel.default_exchange.publish(repub, routing_key=dlq_name)
+            # Publish right back to the DLQ by name via the default exchange. The raw aiormq
+            # channel skips building and validating an aio-pika Message for each republish.
+            await amqp_channel.basic_publish(msg.body, exchange="", routing_key=dlq_name, properties=properties)
             await msg.ack()
-            processed += 1
-
-        if processed:
-            log.debug(f"[DLQ] {dlq_name}: processed {processed}/{cap} (snapshot={initial_count})")
-        return processed
 
     def list_target_dlqs(self) -> list[str]:
         """Return the DLQ names the processor will scan."""
-        return [f"{q}{self._dlq_suffix}" for q in self._queues]
+        return list(self._dlq_names.values())
 
 
 async def setup(bot: core.Genji) -> None:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import typing
 from logging import getLogger
 
-from discord import ButtonStyle, TextStyle, app_commands, ui
+from discord import ButtonStyle, HTTPException, PartialEmoji, TextStyle, app_commands, ui
 from genjipk_sdk.users import (
-    NOTIFICATION_TYPES,
     Notification,
     OverwatchUsernameItem,
     OverwatchUsernamesResponse,
@@ -15,23 +16,46 @@ from genjipk_sdk.users import (
 from utilities.base import BaseCog, BaseView
 
 if typing.TYPE_CHECKING:
+    from genjipk_sdk.users import NOTIFICATION_TYPES
+
     from core.genji import Genji
     from utilities._types import GenjiItx
 
 log = getLogger(__name__)
 
 
-def bool_string(value: bool) -> str:
-    """Return ON or OFF depending on the boolean value given."""
-    if value:
-        return "ON"
-    else:
-        return "OFF"
-
-
 ENABLED_EMOJI = "🔔"
 DISABLED_EMOJI = "🔕"
 
+DM_NOTIFICATIONS: tuple[tuple[Notification, str], ...] = (
+    (Notification.DM_ON_VERIFICATION, "Direct message on completion/records verification."),
+    (Notification.DM_ON_SKILL_ROLE_UPDATE, "Direct message on skill role updates."),
+    (Notification.DM_ON_LOOTBOX_GAIN, "Direct message on lootbox gain."),
+    (Notification.DM_ON_RECORDS_REMOVAL, "Direct message on record/completion removal."),
+    (Notification.DM_ON_PLAYTEST_ALERTS, "Direct message on followed playtest updates."),
+)
+PING_NOTIFICATIONS: tuple[tuple[Notification, str], ...] = (
+    (Notification.PING_ON_XP_GAIN, "Ping in XP channel when XP gained."),
+    (Notification.PING_ON_MASTERY, "Ping in XP channel when map mastery gained."),
+    (Notification.PING_ON_COMMUNITY_RANK_UPDATE, "Ping in XP channel when community rank has changed."),
+)
+
+USERNAMES_DESCRIPTION = (
+    "Set your Overwatch username and alt accounts (if any). This helps speed up the verification process"
+)
+
+PRIMARY_USERNAME_PLACEHOLDER = "Enter your primary Overwatch username. The number after your username is not required."
+ALT_USERNAME_PLACEHOLDER = "Enter an alternate Overwatch username. The number after your username is not required."
+# (attribute, label, placeholder, required) for each Overwatch username field, primary first.
+USERNAME_FIELDS: tuple[tuple[str, str, str, bool], ...] = (
+    ("primary", "Primary Overwatch Username", PRIMARY_USERNAME_PLACEHOLDER, True),
+    ("secondary", "Alt Overwatch Username 1", ALT_USERNAME_PLACEHOLDER, False),
+    ("tertiary", "Alt Overwatch Username 2", ALT_USERNAME_PLACEHOLDER, False),
+)
+
+# Seconds to wait after the last toggle before writing the notification flags to the API.
+FLAGS_FLUSH_DELAY = 0.4
+
 
 class SettingsView(BaseView):
     def __init__(self, flags: Notification, current_usernames: OverwatchUsernamesResponse) -> None:
@@ -43,103 +67,182 @@ class SettingsView(BaseView):
         """
         self.flags = flags
         self.current_usernames = current_usernames
+        self._container: ui.Container | None = None
+        self.usernames_modal: OverwatchUsernameModal | None = None
+        self._saved_flags = flags
+        self._flags_lock = asyncio.Lock()
+        self._flags_flush_task: asyncio.Task | None = None
+        self._flags_itx: GenjiItx | None = None
         super().__init__(timeout=360)
+
+    def schedule_flags_flush(self, itx: GenjiItx) -> None:
+        """Write the changed flags to the API once no toggle has happened for FLAGS_FLUSH_DELAY seconds.
+
+        Args:
+            itx (GenjiItx): The latest toggle interaction, used for the write and to report failures.
+        """
+        self._flags_itx = itx
+        if self._flags_flush_task is not None:
+            self._flags_flush_task.cancel()
+        self._flags_flush_task = asyncio.create_task(self._flush_flags_after(FLAGS_FLUSH_DELAY))
+
+    async def _flush_flags_after(self, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # A newer toggle replaces the task before cancelling it; any other cancellation (e.g. shutdown)
+            # still writes what is pending.
+            if self._flags_flush_task is asyncio.current_task():
+                await self.flush_flags()
+            raise
+        # Detach before writing so a later toggle starts a new timer instead of cancelling this write.
+        self._flags_flush_task = None
+        await self.flush_flags()
+
+    async def flush_flags(self) -> None:
+        """Send one PATCH per flag that differs from the last saved state, concurrently."""
+        async with self._flags_lock:
+            await self._write_changed_flags()
+
+    async def _write_changed_flags(self) -> None:
+        while self._flags_itx and (changed := self.flags ^ self._saved_flags):
+            itx = self._flags_itx
+            flags = self.flags
+            toggled = list(changed)
+            results = await asyncio.gather(
+                *(
+                    itx.client.api.update_notification(
+                        itx.user.id, typing.cast("NOTIFICATION_TYPES", flag.name), bool(flags & flag)
+                    )
+                    for flag in toggled
+                ),
+                return_exceptions=True,
+            )
+            errors: list[tuple[Notification, Exception]] = []
+            for flag, result in zip(toggled, results, strict=True):
+                if isinstance(result, Exception):
+                    errors.append((flag, result))
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self._saved_flags = (self._saved_flags & ~flag) | (flags & flag)
+            if errors:
+                await self._revert_failed_flags(itx, errors)
+                return
+
+    async def _revert_failed_flags(self, itx: GenjiItx, errors: list[tuple[Notification, Exception]]) -> None:
+        """Put failed toggles back to their saved state and report the first error to the user.
+
+        Args:
+            itx (GenjiItx): The interaction the write was made for.
+            errors (list[tuple[Notification, Exception]]): Each flag that failed to save and its error.
+        """
+        for flag, _ in errors:
+            self.flags = (self.flags & ~flag) | (self._saved_flags & flag)
         self.rebuild_components()
+        with contextlib.suppress(HTTPException):
+            await itx.edit_original_response(view=self)
+        flag, error = errors[0]
+        button = next(button for button in self._notification_buttons if button.value == flag)
+        await self.on_error(itx, error, button)
+
+    def stop(self) -> None:
+        """Stop the view, writing any pending notification changes first."""
+        if self.flags != self._saved_flags:
+            if self._flags_flush_task is not None:
+                self._flags_flush_task.cancel()
+            self._flags_flush_task = asyncio.create_task(self.flush_flags())
+        super().stop()
+
+    async def on_timeout(self) -> None:
+        """Save pending notification changes before expiring the view."""
+        if self._flags_flush_task is not None:
+            self._flags_flush_task.cancel()
+            self._flags_flush_task = None
+        await self.flush_flags()
+        await super().on_timeout()
 
     def rebuild_components(self) -> None:
-        """Rebuild the necessary components for the view."""
-        self.clear_items()
-
-        self._dm_on_verfication_button = NotificationButton("DM_ON_VERIFICATION", self.flags)
-        self._dm_on_skill_role_update_button = NotificationButton("DM_ON_SKILL_ROLE_UPDATE", self.flags)
-        self._dm_on_lootbox_gain_button = NotificationButton("DM_ON_LOOTBOX_GAIN", self.flags)
-        self._dm_on_records_removal_button = NotificationButton("DM_ON_RECORDS_REMOVAL", self.flags)
-        self._dm_on_playtest_alerts_button = NotificationButton("DM_ON_PLAYTEST_ALERTS", self.flags)
-        self._ping_on_xp_gain_button = NotificationButton("PING_ON_XP_GAIN", self.flags)
-        self._ping_on_mastery_button = NotificationButton("PING_ON_MASTERY", self.flags)
-        self._ping_on_community_rank_update_button = NotificationButton("PING_ON_COMMUNITY_RANK_UPDATE", self.flags)
-
-        container = ui.Container(
+        """Rebuild the necessary components for the view.
+
+        The component tree is built once; later rebuilds only refresh the dynamic parts in place.
+        """
+        if self._container is not None:
+            for button in self._notification_buttons:
+                button.sync(self.flags)
+            self._usernames_button.current_usernames = self.current_usernames
+            self._end_time_display.content = self._end_time_string
+            return
+
+        dm_buttons = [NotificationButton(value, self.flags) for value, _ in DM_NOTIFICATIONS]
+        ping_buttons = [NotificationButton(value, self.flags) for value, _ in PING_NOTIFICATIONS]
+        self._notification_buttons = (*dm_buttons, *ping_buttons)
+        self._usernames_button = OpenOverwatchUsernamesModalButton(self.current_usernames)
+        self._end_time_display = ui.TextDisplay(self._end_time_string)
+
+        self._container = ui.Container(
             ui.TextDisplay("# Settings"),
             ui.Separator(),
             ui.TextDisplay("### Direct Messages"),
-            ui.Section(
-                ui.TextDisplay("Direct message on completion/records verification."),
-                accessory=self._dm_on_verfication_button,
-            ),
-            ui.Section(
-                ui.TextDisplay("Direct message on skill role updates."),
-                accessory=self._dm_on_skill_role_update_button,
-            ),
-            ui.Section(
-                ui.TextDisplay("Direct message on lootbox gain."),
-                accessory=self._dm_on_lootbox_gain_button,
-            ),
-            ui.Section(
-                ui.TextDisplay("Direct message on record/completion removal."),
-                accessory=self._dm_on_records_removal_button,
-            ),
-            ui.Section(
-                ui.TextDisplay("Direct message on followed playtest updates."),
-                accessory=self._dm_on_playtest_alerts_button,
+            *(
+                ui.Section(ui.TextDisplay(description), accessory=button)
+                for (_, description), button in zip(DM_NOTIFICATIONS, dm_buttons)
             ),
             ui.TextDisplay("### Pings"),
-            ui.Section(
-                ui.TextDisplay("Ping in XP channel when XP gained."),
-                accessory=self._ping_on_xp_gain_button,
-            ),
-            ui.Section(
-                ui.TextDisplay("Ping in XP channel when map mastery gained."),
-                accessory=self._ping_on_mastery_button,
-            ),
-            ui.Section(
-                ui.TextDisplay("Ping in XP channel when community rank has changed."),
-                accessory=self._ping_on_community_rank_update_button,
+            *(
+                ui.Section(ui.TextDisplay(description), accessory=button)
+                for (_, description), button in zip(PING_NOTIFICATIONS, ping_buttons)
             ),
             ui.Separator(),
             ui.TextDisplay("# Overwatch Usernames"),
             ui.Section(
-                ui.TextDisplay(
-                    "Set your Overwatch username and alt accounts (if any). "
-                    "This helps speed up the verification process"
-                ),
-                accessory=OpenOverwatchUsernamesModalButton(self.current_usernames),
+                ui.TextDisplay(USERNAMES_DESCRIPTION),
+                accessory=self._usernames_button,
             ),
             ui.Separator(),
-            ui.TextDisplay(self._end_time_string),
+            self._end_time_display,
         )
-        self.add_item(container)
+        self.add_item(self._container)
 
 
 class NotificationButton(ui.Button["SettingsView"]):
     view: SettingsView
 
-    def __init__(self, notification_type: NOTIFICATION_TYPES, flags: Notification) -> None:
+    # (label, emoji, style) for the disabled and enabled states, indexed by the enabled flag.
+    _STATES: typing.ClassVar[tuple[tuple[str, PartialEmoji, ButtonStyle], ...]] = (
+        ("OFF", PartialEmoji.from_str(DISABLED_EMOJI), ButtonStyle.red),
+        ("ON", PartialEmoji.from_str(ENABLED_EMOJI), ButtonStyle.green),
+    )
+
+    def __init__(self, value: Notification, flags: Notification) -> None:
         """Initialize NotificationButton.
 
         Args:
-            notification_type (NOTIFICATION_TYPES): The type of notification.
+            value (Notification): The notification this button toggles.
             flags (Notification): The flags currently assigned to the user.
         """
         super().__init__()
-        self.notification_type: NOTIFICATION_TYPES = notification_type
-        self.value = getattr(Notification, notification_type, Notification.NONE)
-        enabled = self.value in flags
-        self._edit_button(enabled)
+        self.value = value
+        self._enabled: bool | None = None
+        self.sync(flags)
+
+    def sync(self, flags: Notification) -> None:
+        """Update the button to reflect whether its notification is enabled in the given flags."""
+        self._edit_button(bool(flags & self.value))
 
     async def callback(self, itx: GenjiItx) -> None:
         """Notification button callback."""
         self.view.flags ^= self.value
-        enabled = self.value in self.view.flags
-        self._edit_button(enabled)
+        self.sync(self.view.flags)
         await itx.response.edit_message(view=self.view)
-        await itx.client.api.update_notification(itx.user.id, self.notification_type, enabled)
+        self.view.schedule_flags_flush(itx)
 
     def _edit_button(self, enabled: bool) -> None:
         """Edit button."""
-        self.label = bool_string(enabled)
-        self.emoji = ENABLED_EMOJI if enabled else DISABLED_EMOJI
-        self.style = ButtonStyle.green if enabled else ButtonStyle.red
+        if enabled is self._enabled:
+            return
+        self._enabled = enabled
+        self.label, self.emoji, self.style = self._STATES[enabled]
 
 
 class OpenOverwatchUsernamesModalButton(ui.Button["SettingsView"]):
@@ -156,26 +259,51 @@ class OpenOverwatchUsernamesModalButton(ui.Button["SettingsView"]):
 
     async def callback(self, itx: GenjiItx) -> None:
         """Add Overwatch username button callback."""
+        modal = self.view.usernames_modal
+        if modal is not None and modal.current_usernames is self.current_usernames and not modal.completed:
+            # A dismissed modal is reused. The callback that first opened it is still waiting on it,
+            # so point it at this interaction and let that callback handle the submission.
+            modal.source_itx = itx
+            await itx.response.send_modal(modal)
+            return
+
         modal = OverwatchUsernameModal(self.current_usernames)
+        modal.source_itx = itx
+        self.view.usernames_modal = modal
         await itx.response.send_modal(modal)
         await modal.wait()
         if not modal.completed:
             return
+        assert modal.source_itx
+        itx = modal.source_itx
 
         inputs = (modal.primary, modal.secondary, modal.tertiary)
-        new_usernames = []
-        for i in inputs:
-            assert isinstance(i.component, ui.TextInput)
-            if i.component.value:
-                new_usernames.append(OverwatchUsernameItem(i.component.value, i.text == "Primary Overwatch Username"))
+        values = [typing.cast("ui.TextInput", i.component).value for i in inputs]
+        current = self.current_usernames
+        if tuple(value or None for value in values) == (current.primary, current.secondary, current.tertiary):
+            return
+        # The primary username is always the first field (see USERNAME_FIELDS).
+        new_usernames = [OverwatchUsernameItem(value, idx == 0) for idx, value in enumerate(values) if value]
         await itx.client.api.update_overwatch_usernames(itx.user.id, OverwatchUsernamesUpdateRequest(new_usernames))
-        self.view.current_usernames = await itx.client.api.get_overwatch_usernames(itx.user.id)
+        # The PUT carries the complete state, so derive the stored usernames locally instead of re-fetching.
+        primary = next((item.username for item in new_usernames if item.is_primary), None)
+        alts = [item.username for item in new_usernames if not item.is_primary]
+        self.view.current_usernames = OverwatchUsernamesResponse(
+            user_id=itx.user.id,
+            primary=primary,
+            secondary=alts[0] if alts else None,
+            tertiary=alts[1] if len(alts) > 1 else None,
+        )
         _view = self.view
         self.view.rebuild_components()
         await itx.edit_original_response(view=_view)
 
 
 class OverwatchUsernameModal(ui.Modal):
+    primary: ui.Label
+    secondary: ui.Label
+    tertiary: ui.Label
+
     def __init__(self, current_usernames: OverwatchUsernamesResponse) -> None:
         """Initialize OverwatchUsernameModal.
 
@@ -184,46 +312,25 @@ class OverwatchUsernameModal(ui.Modal):
         """
         self.completed = False
         self.current_usernames = current_usernames
+        self.source_itx: GenjiItx | None = None
         super().__init__(title="Set Overwatch Usernames")
         self.build_components()
 
     def build_components(self) -> None:
         """Build the necessary components."""
-        self.primary = ui.Label(
-            text="Primary Overwatch Username",
-            component=ui.TextInput(
-                style=TextStyle.short,
-                placeholder=("Enter your primary Overwatch username. The number after your username is not required."),
-                default=self.current_usernames.primary,
-                max_length=25,
-                required=True,
-            ),
-        )
-
-        self.secondary = ui.Label(
-            text="Alt Overwatch Username 1",
-            component=ui.TextInput(
-                style=TextStyle.short,
-                placeholder=("Enter an alternate Overwatch username. The number after your username is not required."),
-                default=self.current_usernames.secondary,
-                max_length=25,
-                required=False,
-            ),
-        )
-
-        self.tertiary = ui.Label(
-            text="Alt Overwatch Username 2",
-            component=ui.TextInput(
-                style=TextStyle.short,
-                placeholder=("Enter an alternate Overwatch username. The number after your username is not required."),
-                default=self.current_usernames.tertiary,
-                max_length=25,
-                required=False,
-            ),
-        )
-        self.add_item(self.primary)
-        self.add_item(self.secondary)
-        self.add_item(self.tertiary)
+        for attr, text, placeholder, required in USERNAME_FIELDS:
+            label = ui.Label(
+                text=text,
+                component=ui.TextInput(
+                    style=TextStyle.short,
+                    placeholder=placeholder,
+                    default=getattr(self.current_usernames, attr),
+                    max_length=25,
+                    required=required,
+                ),
+            )
+            setattr(self, attr, label)
+            self.add_item(label)
 
     async def on_submit(self, itx: GenjiItx) -> None:
         """Callback for the modal."""
@@ -236,8 +343,10 @@ class SettingsCog(BaseCog):
     async def settings(self, itx: GenjiItx) -> None:
         """Change various settings like notifications and your display name."""
         await itx.response.defer(ephemeral=True)
-        flags = await self.bot.api.get_notification_flags(itx.user.id)
-        current_usernames = await self.bot.api.get_overwatch_usernames(itx.user.id)
+        flags, current_usernames = await asyncio.gather(
+            self.bot.api.get_notification_flags(itx.user.id),
+            self.bot.api.get_overwatch_usernames(itx.user.id),
+        )
         view = SettingsView(flags, current_usernames)
         await itx.edit_original_response(view=view)
         view.original_interaction = itx
@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
+import array
 import asyncio
+import contextlib
 import io
-from typing import TYPE_CHECKING, Annotated, Any, Iterable, Literal, Optional, Sequence, TypedDict
+from logging import getLogger
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    overload,
+)
 
 import discord
 from discord import Message, app_commands
@@ -29,6 +46,7 @@ from genjipk_sdk.tags import (
 )
 
 from utilities.base import ConfirmationView
+from utilities.cache import TTLCache
 
 from .tags_paginator import SimplePages
 
@@ -36,6 +54,68 @@ if TYPE_CHECKING:
     from core import Genji
     from utilities._types import GenjiCtx, GenjiItx
 
+log = getLogger(__name__)
+
+AutocompleteMode = Literal["aliased", "non_aliased", "owned_aliased", "owned_non_aliased"]
+
+# Autocomplete fires on every keystroke; wait this long for typing to settle before querying the API.
+AUTOCOMPLETE_DEBOUNCE = 0.075
+
+AUTOCOMPLETE_CACHE_TTL = 10.0
+AUTOCOMPLETE_CACHE_SIZE = 1024
+
+# Tag usage counters are batched and written at most once per this many seconds.
+USAGE_FLUSH_DELAY = 0.5
+USAGE_FLUSH_BATCH_SIZE = 100
+
+
+def _permissions_matcher(perms: dict[str, bool], check=all) -> Callable[[int], bool]:  # noqa: ANN001
+    """Compile a permission mapping into a predicate over a raw permissions value.
+
+    The common all/any aggregators are reduced to bitmask comparisons; other
+    aggregators fall back to testing each flag individually.
+
+    Args:
+        perms: Mapping of permission name to required boolean value.
+        check: Aggregation function applied to the per-permission comparisons.
+
+    Raises:
+        TypeError: If a permission name is not a valid Discord permission.
+
+    Returns:
+        A callable that takes a Permissions.value and returns whether it satisfies the mapping.
+    """
+    flags = discord.Permissions.VALID_FLAGS
+    invalid = perms.keys() - flags.keys()
+    if invalid:
+        raise TypeError(f"Invalid permission(s): {', '.join(sorted(invalid))}")
+    granted = sum(flags[name] for name, value in perms.items() if value)
+    denied = sum(flags[name] for name, value in perms.items() if not value)
+    if check is all:
+        return lambda value: value & granted == granted and not value & denied
+    if check is any:
+        return lambda value: bool(value & granted) or value & denied != denied
+    return lambda value: check(bool(value & flags[name]) == wanted for name, wanted in perms.items())
+
+
+async def _is_owner(ctx: GenjiCtx) -> bool:
+    # Bot.is_owner resolves and stores owner_id/owner_ids on first use; after that a set lookup is enough.
+    bot = ctx.bot
+    if bot.owner_id is not None:
+        return ctx.author.id == bot.owner_id
+    if bot.owner_ids:
+        return ctx.author.id in bot.owner_ids
+    return await bot.is_owner(ctx.author)
+
+
+async def _check_guild_permissions(ctx: GenjiCtx, matches: Callable[[int], bool]) -> bool:
+    if ctx.guild is None:
+        return await _is_owner(ctx)
+    resolved = ctx.author.guild_permissions  # pyright: ignore[reportAttributeAccessIssue]
+    if matches(resolved.value):
+        return True
+    return await _is_owner(ctx)
+
 
 async def check_guild_permissions(ctx: GenjiCtx, perms: dict[str, bool], *, check=all) -> bool:  # noqa: ANN001
     """Check whether the invoking user has the specified guild permissions.
@@ -53,20 +133,15 @@ async def check_guild_permissions(ctx: GenjiCtx, perms: dict[str, bool], *, chec
     Returns:
         True if the user satisfies the permission check, otherwise False.
     """
-    is_owner = await ctx.bot.is_owner(ctx.author)
-    if is_owner:
-        return True
-    if ctx.guild is None:
-        return False
-    resolved = ctx.author.guild_permissions  # pyright: ignore[reportAttributeAccessIssue]
-    return check(getattr(resolved, name, None) == value for name, value in perms.items())
+    return await _check_guild_permissions(ctx, _permissions_matcher(perms, check))
 
 
 def has_guild_permissions(*, check=all, **perms: bool) -> Any:  # noqa: ANN001, ANN401
     """Create a commands.check that ensures the invoker has given guild permissions.
 
     Wraps check_guild_permissions with a provided aggregator and a set of
-    required permission flags.
+    required permission flags. The permission mask is computed once, when the
+    check is created.
 
     Keyword Args:
         check: Aggregation function over permission comparisons, e.g. all or any.
@@ -75,14 +150,15 @@ def has_guild_permissions(*, check=all, **perms: bool) -> Any:  # noqa: ANN001,
     Returns:
         A discord.py command check predicate.
     """
+    matches = _permissions_matcher(perms, check)
 
     async def pred(ctx: GenjiCtx) -> bool:
-        return await check_guild_permissions(ctx, perms, check=check)
+        return await _check_guild_permissions(ctx, matches)
 
     return commands.check(pred)
 
 
-class TagEntry(TypedDict):
+class TagEntry(NamedTuple):
     id: int
     name: str
     content: str
@@ -92,44 +168,63 @@ class TagAllFlags(commands.FlagConverter):
     text: bool = commands.flag(default=False, description="Whether to dump the tags as a text file.")
 
 
-class TagPageEntry:
-    __slots__ = ("id", "name")
+class TagPageTable(Sequence[str]):
+    __slots__ = ("ids", "names")
 
-    def __init__(self, entry: TagEntry) -> None:
-        """Initialize a display-only page entry for a tag.
+    def __init__(self, rows: Iterable[TagRowDTO]) -> None:
+        """Initialize a display-only table of tag ids and names.
+
+        Ids and names are kept in two parallel columns instead of one object per
+        tag; labels are only formatted for the page being shown.
 
         Args:
-            entry: A raw tag entry containing id and name.
+            rows: Tag rows to display.
         """
-        self.id: int = entry["id"]
-        self.name: str = entry["name"]
+        self.ids: array.array[int] = array.array("q")
+        self.names: list[str] = []
+        for row in rows:
+            self.ids.append(row.id)
+            self.names.append(row.name)
+
+    def __len__(self) -> int:
+        """Return the number of tags in the table."""
+        return len(self.names)
 
-    def __str__(self) -> str:
-        """Return a human-readable label for the page entry.
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Return the label(s) at the given position.
 
         Returns:
-            A string of the form "name (ID: <id>)".
+            A string of the form "name (ID: <id>)", or a list of them for a slice.
         """
-        return f"{self.name} (ID: {self.id})"
+        if isinstance(index, slice):
+            return [f"{name} (ID: {id_})" for name, id_ in zip(self.names[index], self.ids[index])]
+        return f"{self.names[index]} (ID: {self.ids[index]})"
 
 
 class TagPages(SimplePages):
-    def __init__(self, entries: list[TagEntry], *, ctx: GenjiCtx, per_page: int = 12) -> None:
-        """Initialize a paginator for tag entries.
+    def __init__(self, rows: Iterable[TagRowDTO], *, ctx: GenjiCtx, per_page: int = 12) -> None:
+        """Initialize a paginator for tag rows.
 
-        Converts raw tag rows into TagPageEntry objects and forwards them to the
-        base paginator.
+        Packs the rows into a TagPageTable and forwards it to the base paginator.
 
         Args:
-            entries: Raw tag rows to paginate.
+            rows: Tag rows to paginate.
             ctx: Invocation context used by the paginator for sending pages.
             per_page: Number of entries per page.
         """
-        converted = [TagPageEntry(entry) for entry in entries]
-        super().__init__(converted, per_page=per_page, ctx=ctx)
+        super().__init__(TagPageTable(rows), per_page=per_page, ctx=ctx)
 
 
 class TagName(commands.clean_content):
+    # Names of the tag group's subcommands; filled in once by the Tags cog when it is created.
+    reserved_words: ClassVar[frozenset[str]] = frozenset()
+
     def __init__(self, *, lower: bool = False) -> None:
         """Initialize the TagName converter.
 
@@ -157,16 +252,15 @@ class TagName(commands.clean_content):
             The cleaned tag name, optionally lowercased based on configuration.
         """
         converted = await super().convert(ctx, argument)
-        lower = converted.lower().strip()
-        if not lower:
+        cleaned = converted.strip()
+        if not cleaned:
             raise commands.BadArgument("Missing tag name.")
-        if len(lower) > 100:  # noqa: PLR2004
+        if len(cleaned) > 100:  # noqa: PLR2004
             raise commands.BadArgument("Tag name is a maximum of 100 characters.")
-        first_word, _, _ = lower.partition(" ")
-        root: commands.GroupMixin = ctx.bot.get_command("tag")  # type: ignore
-        if first_word in root.all_commands:
+        first_word, _, _ = cleaned.partition(" ")
+        if first_word.lower() in self.reserved_words:
             raise commands.BadArgument("This tag name starts with a reserved word.")
-        return converted.strip() if not self.lower else lower
+        return cleaned.lower() if self.lower else cleaned
 
 
 class TagEditModal(discord.ui.Modal, title="Edit Tag"):
@@ -239,13 +333,10 @@ class TagMakeModal(discord.ui.Modal, title="Create New Tag"):
         assert interaction.guild_id is not None
         name = str(self.name)
         try:
-            name = await TagName().convert(self.ctx, name)
+            name = await self.cog.tag_name_converter.convert(self.ctx, name)
         except commands.BadArgument as e:
             await interaction.response.send_message(str(e), ephemeral=True)
-            raise e
-            return
-        except Exception as e:
-            raise e
+            raise
         if self.cog.is_tag_being_made(interaction.guild_id, name):
             await interaction.response.send_message("This tag is already being made by someone else.", ephemeral=True)
             return
@@ -265,7 +356,18 @@ class Tags(commands.Cog):
             bot: The bot instance.
         """
         self.bot: Genji = bot
-        self._reserved_tags_being_made: dict[int, set[str]] = {}
+        TagName.reserved_words = frozenset(self.tag.all_commands)
+        self.tag_name_converter = TagName()
+        self._clean_content = commands.clean_content()
+        self._reserved_tags_being_made: set[tuple[int, str]] = set()
+        self._ac_latest_query: dict[tuple[int, int, AutocompleteMode, int | None], object] = {}
+        # Keys embed the guild's generation so a mutation invalidates every cached prefix for that guild at once.
+        self._ac_generation: dict[int, int] = {}
+        self._ac_cache: TTLCache[tuple[int, int, AutocompleteMode, int | None, str, int], TagsAutocompleteResponse] = (
+            TTLCache(AUTOCOMPLETE_CACHE_SIZE, AUTOCOMPLETE_CACHE_TTL)
+        )
+        self._pending_increments: dict[tuple[int, str], int] = {}
+        self._increment_flush_task: asyncio.Task | None = None
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -276,6 +378,16 @@ class Tags(commands.Cog):
         """
         return discord.PartialEmoji(name="\N{LABEL}\ufe0f")
 
+    async def cog_unload(self) -> None:
+        """Write any buffered tag usage counts before the cog is unloaded."""
+        task = self._increment_flush_task
+        if task is not None and not task.done():
+            # Only the delay is cut short; a write that has already started is finished by the task itself.
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush_increments()
+
     async def cog_command_error(self, ctx: GenjiCtx, error: commands.CommandError) -> None:
         """Common command error handler for this cog.
 
@@ -368,12 +480,27 @@ class Tags(commands.Cog):
             A TagsMutateResponse containing the results of each operation.
         """
         req = TagsMutateRequest(list(ops))
-        return await self.bot.api.mutate_tags(req)
+        try:
+            return await self.bot.api.mutate_tags(req)
+        finally:
+            for guild_id in {op.guild_id for op in ops if not isinstance(op, OpIncrementUsage)}:
+                self._ac_generation[guild_id] = self._ac_generation.get(guild_id, 0) + 1
+
+    async def _api_mutate_many(self, groups: Sequence[Sequence[Any]]) -> list[TagsMutateResponse]:
+        """Send several independent mutation requests concurrently.
+
+        Args:
+            groups: Operation groups; each group is sent as its own mutation request.
+
+        Returns:
+            The TagsMutateResponse for each group, in the same order as `groups`.
+        """
+        return await asyncio.gather(*(self._api_mutate(*group) for group in groups))
 
     async def _api_autocomplete(
         self,
         guild_id: int,
-        mode: Literal["aliased", "non_aliased", "owned_aliased", "owned_non_aliased"],
+        mode: AutocompleteMode,
         q: str,
         *,
         owner_id: int | None = None,
@@ -382,7 +509,8 @@ class Tags(commands.Cog):
         """Perform a tag autocomplete lookup via the API.
 
         Queries tag names for use in Discord autocomplete menus, supporting
-        different modes for alias ownership and visibility.
+        different modes for alias ownership and visibility. Responses are kept
+        in a small LRU cache for AUTOCOMPLETE_CACHE_TTL seconds.
 
         Args:
             guild_id: The guild whose tags to search.
@@ -395,20 +523,15 @@ class Tags(commands.Cog):
         Returns:
             A TagsAutocompleteResponse from the API.
         """
-        req = TagsAutocompleteRequest(guild_id=guild_id, q=q, mode=mode, owner_id=owner_id, limit=limit)
-        return await self.bot.api.autocomplete_tags(req)
-
-    async def get_possible_tags(self, guild: discord.abc.Snowflake) -> list[TagEntry]:
-        """Fetch all tags for a guild, including content.
-
-        Args:
-            guild: Guild-like object providing an id.
+        key = (guild_id, self._ac_generation.get(guild_id, 0), mode, owner_id, q.lower(), limit)
+        cached = self._ac_cache.get(key)
+        if cached is not None:
+            return cached
 
-        Returns:
-            A list of tag entries, each with id, name, and content.
-        """
-        res = await self._api_search(guild.id, include_content=True, limit=1000)
-        return [{"id": r.id, "name": r.name, "content": r.content or ""} for r in res.items]
+        req = TagsAutocompleteRequest(guild_id=guild_id, q=q, mode=mode, owner_id=owner_id, limit=limit)
+        res = await self.bot.api.autocomplete_tags(req)
+        self._ac_cache.set(key, res)
+        return res
 
     async def get_random_tag(self, guild: discord.abc.Snowflake) -> Optional[TagEntry]:
         """Retrieve a single random tag from a guild.
@@ -417,14 +540,14 @@ class Tags(commands.Cog):
             guild: Guild-like object providing an id.
 
         Returns:
-            A tag entry dict containing id, name, and content,
+            A TagEntry with id, name, and content,
             or None if the guild has no tags.
         """
         res = await self._api_search(guild.id, random=True, include_content=True, limit=1)
         if not res.items:
             return None
         r = res.items[0]
-        return {"id": r.id, "name": r.name, "content": r.content or ""}
+        return TagEntry(r.id, r.name, r.content or "")
 
     async def get_tag(self, guild_id: Optional[int], name: str) -> TagEntry:
         """Retrieve a tag by name for a given guild.
@@ -440,7 +563,7 @@ class Tags(commands.Cog):
             RuntimeError: If the tag is not found.
 
         Returns:
-            A tag entry dict containing id, name, and content.
+            A TagEntry with id, name, and content.
         """
         res = await self._api_search(guild_id or 0, name=name, include_content=True, fuzzy=False, limit=1)
         if not res.items:
@@ -449,7 +572,7 @@ class Tags(commands.Cog):
                 raise RuntimeError(f"Tag not found. Did you mean...\n{names}")
             raise RuntimeError("Tag not found.")
         item = res.items[0]
-        return {"id": item.id, "name": item.name, "content": item.content or ""}
+        return TagEntry(item.id, item.name, item.content or "")
 
     async def create_tag(self, ctx: GenjiCtx, name: str, content: str) -> None:
         """Create a new tag owned by the invoking user.
@@ -470,6 +593,50 @@ class Tags(commands.Cog):
             return
         await ctx.send(f"Tag {name} successfully created.")
 
+    def schedule_increment(self, guild_id: int, name: str) -> None:
+        """Buffer a usage increment for a tag and schedule a batched write.
+
+        Args:
+            guild_id: ID of the guild the tag belongs to.
+            name: Name of the tag that was used.
+        """
+        key = (guild_id, name)
+        self._pending_increments[key] = self._pending_increments.get(key, 0) + 1
+        if self._increment_flush_task is None or self._increment_flush_task.done():
+            self._increment_flush_task = asyncio.create_task(self._flush_increments_after(USAGE_FLUSH_DELAY))
+
+    async def _flush_increments_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # flush_increments has already taken the buffered counts by the time it awaits the API,
+        # so a cancellation at that point must not abandon the write.
+        flush = asyncio.ensure_future(self.flush_increments())
+        try:
+            await asyncio.shield(flush)
+        except asyncio.CancelledError:
+            await flush
+            raise
+
+    async def flush_increments(self) -> None:
+        """Send all buffered usage increments to the API, USAGE_FLUSH_BATCH_SIZE ops per request."""
+        pending, self._pending_increments = self._pending_increments, {}
+        if not pending:
+            return
+        # OpIncrementUsage has no delta field, so repeated uses are sent as repeated ops in the same request.
+        ops = [
+            OpIncrementUsage(guild_id=guild_id, name=name)
+            for (guild_id, name), count in pending.items()
+            for _ in range(count)
+        ]
+        groups = [ops[i : i + USAGE_FLUSH_BATCH_SIZE] for i in range(0, len(ops), USAGE_FLUSH_BATCH_SIZE)]
+        try:
+            await self._api_mutate_many(groups)
+        except Exception:
+            log.exception("Failed to write %d tag usage increments.", len(ops))
+
+    @staticmethod
+    def _in_progress_key(guild_id: int, name: str) -> tuple[int, str]:
+        return guild_id, name.lower()
+
     def is_tag_being_made(self, guild_id: int, name: str) -> bool:
         """Check if a tag is currently being made by someone else.
 
@@ -480,35 +647,62 @@ class Tags(commands.Cog):
         Returns:
             True if another user is already in the process of creating the tag.
         """
-        return name.lower() in self._reserved_tags_being_made.get(guild_id, set())
+        return self._in_progress_key(guild_id, name) in self._reserved_tags_being_made
 
     def add_in_progress_tag(self, guild_id: int, name: str) -> None:
         """Mark a tag as being in progress for creation.
 
-        Adds the tag name to the set of reserved tags for the guild.
+        Adds the tag name to the set of reserved tags.
 
         Args:
             guild_id: ID of the guild.
             name: Tag name being created.
         """
-        self._reserved_tags_being_made.setdefault(guild_id, set()).add(name.lower())
+        self._reserved_tags_being_made.add(self._in_progress_key(guild_id, name))
 
     def remove_in_progress_tag(self, guild_id: int, name: str) -> None:
         """Unmark a tag as in progress for a guild.
 
-        Removes the tag name from the reserved list. Deletes the guild key
-        if no tags remain in progress.
-
         Args:
             guild_id: ID of the guild.
             name: Tag name to clear.
         """
-        g = self._reserved_tags_being_made.get(guild_id)
-        if not g:
-            return
-        g.discard(name.lower())
-        if not g:
-            del self._reserved_tags_being_made[guild_id]
+        self._reserved_tags_being_made.discard(self._in_progress_key(guild_id, name))
+
+    async def _autocomplete_debounced(
+        self,
+        mode: AutocompleteMode,
+        interaction: GenjiItx,
+        current: str,
+        *,
+        owner_id: int | None = None,
+    ) -> list[app_commands.Choice[str]]:
+        """Debounce autocomplete lookups per guild, user, mode and owner.
+
+        Records the query as the latest for its key and waits briefly. If a newer
+        keystroke arrives in the meantime, this query is dropped without hitting the API.
+
+        Args:
+            mode: Autocomplete mode passed through to the API.
+            interaction: The interaction object invoking the autocomplete.
+            current: Partial query string from the user.
+            owner_id: Restrict suggestions to tags owned by this user.
+
+        Returns:
+            A list of Choice objects representing matching tag names, or an empty
+            list if the query was superseded.
+        """
+        assert interaction.guild_id
+        key = (interaction.guild_id, interaction.user.id, mode, owner_id)
+        token = self._ac_latest_query[key] = object()
+        await asyncio.sleep(AUTOCOMPLETE_DEBOUNCE)
+        if self._ac_latest_query.get(key) is not token:
+            return []
+        res = await self._api_autocomplete(interaction.guild_id, mode, current, owner_id=owner_id)
+        # Only clear the entry if no newer keystroke replaced it while the lookup ran.
+        if self._ac_latest_query.get(key) is token:
+            del self._ac_latest_query[key]
+        return [app_commands.Choice(name=a, value=a) for a in res.items]
 
     async def non_aliased_tag_autocomplete(self, interaction: GenjiItx, current: str) -> list[app_commands.Choice[str]]:
         """Provide autocomplete suggestions for non-aliased tags.
@@ -522,10 +716,7 @@ class Tags(commands.Cog):
         Returns:
             A list of Choice objects representing matching tag names.
         """
-        res = await interaction.client.api.autocomplete_tags(
-            TagsAutocompleteRequest(guild_id=interaction.guild_id, q=current, mode="non_aliased", limit=12)  # pyright: ignore[reportArgumentType]
-        )
-        return [app_commands.Choice(name=a, value=a) for a in res.items]
+        return await self._autocomplete_debounced("non_aliased", interaction, current)
 
     async def aliased_tag_autocomplete(self, interaction: GenjiItx, current: str) -> list[app_commands.Choice[str]]:
         """Provide autocomplete suggestions for aliased tags.
@@ -539,10 +730,7 @@ class Tags(commands.Cog):
         Returns:
             A list of Choice objects representing matching tag names.
         """
-        res = await interaction.client.api.autocomplete_tags(
-            TagsAutocompleteRequest(guild_id=interaction.guild_id, q=current, mode="aliased", limit=12)  # pyright: ignore[reportArgumentType]
-        )
-        return [app_commands.Choice(name=a, value=a) for a in res.items]
+        return await self._autocomplete_debounced("aliased", interaction, current)
 
     async def owned_non_aliased_tag_autocomplete(
         self, interaction: GenjiItx, current: str
@@ -556,16 +744,9 @@ class Tags(commands.Cog):
         Returns:
             A list of Choice objects representing matching tag names.
         """
-        res = await interaction.client.api.autocomplete_tags(
-            TagsAutocompleteRequest(
-                guild_id=interaction.guild_id,  # pyright: ignore[reportArgumentType]
-                q=current,
-                mode="owned_non_aliased",
-                owner_id=interaction.user.id,
-                limit=12,
-            )
+        return await self._autocomplete_debounced(
+            "owned_non_aliased", interaction, current, owner_id=interaction.user.id
         )
-        return [app_commands.Choice(name=a, value=a) for a in res.items]
 
     async def owned_aliased_tag_autocomplete(
         self, interaction: GenjiItx, current: str
@@ -579,16 +760,7 @@ class Tags(commands.Cog):
         Returns:
             A list of Choice objects representing matching tag names.
         """
-        res = await interaction.client.api.autocomplete_tags(
-            TagsAutocompleteRequest(
-                guild_id=interaction.guild_id,  # pyright: ignore[reportArgumentType]
-                q=current,
-                mode="owned_aliased",
-                owner_id=interaction.user.id,
-                limit=12,
-            )
-        )
-        return [app_commands.Choice(name=a, value=a) for a in res.items]
+        return await self._autocomplete_debounced("owned_aliased", interaction, current, owner_id=interaction.user.id)
 
     @commands.hybrid_group(fallback="get")
     @commands.guild_only()
@@ -619,10 +791,8 @@ class Tags(commands.Cog):
             tag = await self.get_tag(ctx.guild.id, name)  # pyright: ignore[reportOptionalMemberAccess]
         except RuntimeError as e:
             return await ctx.send(str(e))
-        await ctx.send(tag["content"])
-
-        op = OpIncrementUsage(guild_id=ctx.guild.id, name=tag["name"])  # pyright: ignore[reportOptionalMemberAccess]
-        await self._api_mutate(op)
+        await ctx.send(tag.content)
+        self.schedule_increment(ctx.guild.id, tag.name)  # pyright: ignore[reportOptionalMemberAccess]
 
     @tag.command()
     @commands.guild_only()
@@ -648,12 +818,12 @@ class Tags(commands.Cog):
         ctx: GenjiCtx,
         name: Annotated[str, TagName],
         *,
-        content: Annotated[str, commands.clean_content],
+        content: str,
     ) -> Message | None:
         """Create a new tag owned by the invoking user.
 
         Validates tag name and content length, then sends a creation
-        request to the API.
+        request to the API. Oversized content is rejected before it is cleaned.
 
         Args:
             ctx: Invocation context.
@@ -662,6 +832,9 @@ class Tags(commands.Cog):
         """
         if self.is_tag_being_made(ctx.guild.id, name):  # pyright: ignore[reportOptionalMemberAccess]
             return await ctx.send("This tag is currently being made by someone.")
+        if len(content) > 2000:  # noqa: PLR2004
+            return await ctx.send("Tag content is a maximum of 2000 characters.")
+        content = await self._clean_content.convert(ctx, content)
         if len(content) > 2000:  # noqa: PLR2004
             return await ctx.send("Tag content is a maximum of 2000 characters.")
         await self.create_tag(ctx, name, content)
@@ -714,7 +887,7 @@ class Tags(commands.Cog):
             return
 
         await ctx.send("Hello. What would you like the tag's name to be?")
-        converter = TagName()
+        converter = self.tag_name_converter
         original = ctx.message
 
         def check(msg) -> bool:  # noqa: ANN001
@@ -738,6 +911,7 @@ class Tags(commands.Cog):
                 f'Sorry. This tag is currently being made by someone. Redo the command "{ctx.prefix}tag make" to retry.'
             )
 
+        # Checked before asking for content so the user does not write a whole tag only to have it rejected.
         exists = await self._api_search(ctx.guild.id, name=name, fuzzy=False, limit=1)  # pyright: ignore[reportOptionalMemberAccess]
         if exists.items:
             return await ctx.send(
@@ -759,8 +933,11 @@ class Tags(commands.Cog):
         if msg.content == f"{ctx.prefix}abort":
             self.remove_in_progress_tag(ctx.guild.id, name)  # pyright: ignore[reportOptionalMemberAccess]
             return await ctx.send("Aborting.")
+        elif len(msg.content) > 2000:  # noqa: PLR2004
+            self.remove_in_progress_tag(ctx.guild.id, name)  # pyright: ignore[reportOptionalMemberAccess]
+            return await ctx.send("Tag content is a maximum of 2000 characters.")
         elif msg.content:
-            clean_content = await commands.clean_content().convert(ctx, msg.content)
+            clean_content = await self._clean_content.convert(ctx, msg.content)
         else:
             clean_content = msg.content
 
@@ -950,8 +1127,8 @@ class Tags(commands.Cog):
     async def raw(self, ctx: GenjiCtx, *, name: Annotated[str, TagName(lower=True)]) -> Message | None:
         """Display the raw, markdown-escaped content of a tag.
 
-        If the content exceeds Discord's message limit, it is uploaded
-        as a text file attachment instead.
+        If the content exceeds Discord's message limit, the unescaped content
+        is uploaded as a text file attachment instead.
 
         Args:
             ctx: Invocation context.
@@ -961,16 +1138,14 @@ class Tags(commands.Cog):
             tag = await self.get_tag(ctx.guild.id, name)  # pyright: ignore[reportOptionalMemberAccess]
         except RuntimeError as e:
             return await ctx.send(str(e))
-        first_step = discord.utils.escape_markdown(tag["content"])
-
-        content = first_step.replace("<", "\\<")
+        # A text attachment shows content verbatim, so only escape what will be sent as a message.
+        content = tag.content
+        if len(content) <= 2000:  # noqa: PLR2004
+            content = discord.utils.escape_markdown(content).replace("<", "\\<")
         if len(content) > 2000:  # noqa: PLR2004
-            fp = io.BytesIO(content.encode())
+            fp = io.BytesIO(tag.content.encode())
             return await ctx.send(file=discord.File(fp, filename="message_too_long.txt"))
-        else:
-            return await ctx.send(content)
-
-        await ctx.safe_send(first_step.replace("<", "\\<"), escape_mentions=False)
+        return await ctx.send(content)
 
     @tag.command(name="list")
     @commands.guild_only()
@@ -987,8 +1162,7 @@ class Tags(commands.Cog):
         res = await self._api_search(ctx.guild.id, owner_id=member.id, include_aliases=True, limit=1000, sort_by="name")  # pyright: ignore[reportOptionalMemberAccess]
         rows = res.items
         if rows:
-            entries: list[TagEntry] = [{"id": r.id, "name": r.name, "content": ""} for r in rows]
-            p = TagPages(entries=entries, ctx=ctx)
+            p = TagPages(rows, ctx=ctx)
             p.embed.set_author(name=member.display_name, icon_url=member.display_avatar.url)
             await p.start()
         else:
@@ -1024,7 +1198,11 @@ class Tags(commands.Cog):
         table = TabularData()
         table.set_columns(["id", "name", "owner_id", "uses", "is_alias"])
         table.add_rows([[r.id, r.name, r.owner_id, r.uses or 0, r.is_alias] for r in rows])
-        fp = io.BytesIO(table.render().encode("utf-8"))
+        fp = io.BytesIO()
+        writer = io.TextIOWrapper(fp, encoding="utf-8", newline="\n", write_through=True)
+        table.write_to(writer)
+        writer.detach()
+        fp.seek(0)
         await ctx.send(file=discord.File(fp, "tags.txt"))
 
     @tag.command(name="all", usage="[text: yes|no]")
@@ -1043,8 +1221,7 @@ class Tags(commands.Cog):
         res = await self._api_search(ctx.guild.id, include_aliases=True, limit=1000, sort_by="name")  # pyright: ignore[reportOptionalMemberAccess]
         rows = res.items
         if rows:
-            entries: list[TagEntry] = [{"id": r.id, "name": r.name, "content": ""} for r in rows]
-            p = TagPages(entries=entries, per_page=20, ctx=ctx)
+            p = TagPages(rows, per_page=20, ctx=ctx)
             await p.start()
         else:
             await ctx.send("This server has no server-specific tags.")
@@ -1097,8 +1274,7 @@ class Tags(commands.Cog):
             return await ctx.send("The query length must be at least three characters.")
         res = await self._api_search(ctx.guild.id, name=query, fuzzy=True, include_aliases=True, limit=100)  # pyright: ignore[reportOptionalMemberAccess]
         if res.items:
-            entries: list[TagEntry] = [{"id": r.id, "name": r.name, "content": ""} for r in res.items]
-            p = TagPages(entries=entries, per_page=20, ctx=ctx)
+            p = TagPages(res.items, per_page=20, ctx=ctx)
             await p.start()
         else:
             await ctx.send("No tags found.")
@@ -1178,47 +1354,58 @@ class Tags(commands.Cog):
         tag = await self.get_random_tag(ctx.guild)  # pyright: ignore[reportArgumentType]
         if tag is None:
             return await ctx.send("This server has no tags.")
-        await ctx.send(f"Random tag found: {tag['name']}\n{tag['content']}")
+        await ctx.send(f"Random tag found: {tag.name}\n{tag.content}")
 
 
 class TabularData:
     def __init__(self) -> None:
         """Initialize an empty table for ASCII-style tabular data rendering."""
-        self._widths: list[int] = []
         self._columns: list[str] = []
         self._rows: list[list[str]] = []
 
     def set_columns(self, columns: list[str]) -> None:
-        """Set the header columns for the table and initialize column widths.
+        """Set the header columns for the table.
 
         Args:
             columns: List of column header strings.
         """
         self._columns = columns
-        self._widths = [len(c) + 2 for c in columns]
 
     def add_row(self, row: Iterable[Any]) -> None:
         """Add a single row of data to the table.
 
-        Automatically adjusts column widths to fit the new row.
-
         Args:
             row: Iterable of cell values for the new row.
         """
-        rows = [str(r) for r in row]
-        self._rows.append(rows)
-        for index, element in enumerate(rows):
-            width = len(element) + 2
-            self._widths[index] = max(width, self._widths[index])
+        self._rows.append([str(r) for r in row])
 
     def add_rows(self, rows: Iterable[Iterable[Any]]) -> None:
-        """Add multiple rows of data to the table sequentially.
+        """Add multiple rows of data to the table.
 
         Args:
             rows: Iterable of row iterables, each representing one table row.
         """
-        for row in rows:
-            self.add_row(row)
+        self._rows.extend([str(r) for r in row] for row in rows)
+
+    def _column_widths(self) -> list[int]:
+        """Compute each column's width, including padding, in one pass per column."""
+        widths = [len(c) for c in self._columns]
+        for index, column in enumerate(zip(*self._rows)):
+            widths[index] = max(widths[index], *map(len, column))
+        return [w + 2 for w in widths]
+
+    def _lines(self) -> Iterator[str]:
+        """Yield the rendered table line by line: borders, header, and rows."""
+        widths = self._column_widths()
+        sep = "+".join("-" * w for w in widths)
+        sep = f"+{sep}+"
+        row_fmt = "|" + "|".join(f"{{:^{w}}}" for w in widths) + "|"
+        yield sep
+        yield row_fmt.format(*self._columns)
+        yield sep
+        for row in self._rows:
+            yield row_fmt.format(*row)
+        yield sep
 
     def render(self) -> str:
         """Render the table as a formatted ASCII string.
@@ -1228,17 +1415,16 @@ class TabularData:
         Returns:
             A string representing the rendered table.
         """
-        sep = "+".join("-" * w for w in self._widths)
-        sep = f"+{sep}+"
-        to_draw = [sep]
+        return "\n".join(self._lines())
 
-        def get_entry(d: Sequence) -> str:
-            elem = "|".join(f"{e:^{self._widths[i]}}" for i, e in enumerate(d))
-            return f"|{elem}|"
+    def write_to(self, stream: IO[str]) -> None:
+        """Write the rendered table to a text stream one line at a time.
 
-        to_draw.append(get_entry(self._columns))
-        to_draw.append(sep)
-        for row in self._rows:
-            to_draw.append(get_entry(row))
-        to_draw.append(sep)
-        return "\n".join(to_draw)
+        Avoids building the whole table as a single string first.
+
+        Args:
+            stream: The text stream to write to.
+        """
+        for line in self._lines():
+            stream.write(line)
+            stream.write("\n")
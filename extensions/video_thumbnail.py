@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional, Sequence, Tuple
-from urllib.parse import urlsplit, urlunsplit
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
 import aiohttp
+import msgspec
 from yarl import URL
 
+from utilities.cache import TTLCache
+
 if TYPE_CHECKING:
     from core.genji import Genji
 
@@ -18,12 +22,27 @@ YOUTUBE_URL_REGEX = re.compile(
     r"?v=|embed\/|v\/|e\/)|youtu\.be\/)(?P<video_id_3>[\w\-]{10,20})",
     re.IGNORECASE,
 )
+# A whole path segment holding a BV id (case-sensitive) or an av number, e.g. /video/BV1sQtmzcE5x or /video/av123.
+# Matched against the URL path only, so query strings and fragments are never searched.
+BILIBILI_VIDEO_ID_REGEX = re.compile(r"/(?:(BV[0-9A-Za-z]+)|(?i:av)(\d+))(?=/|$)")
+
+# Bilibili shortlinks and cover images are effectively immutable; remember them for an hour.
+BILIBILI_CACHE_TTL = 3600.0
+BILIBILI_CACHE_SIZE = 2048
+
+
+class _BilibiliViewData(msgspec.Struct):
+    pic: str = ""
+
+
+class _BilibiliViewResponse(msgspec.Struct):
+    """The slice of the Bilibili view API response used here; every other field is skipped while decoding."""
+
+    code: int
+    data: _BilibiliViewData | None = None
 
 
-def _trim_url_keep_path(url: str) -> str:
-    """Remove query/fragment to normalize path-based ID extraction."""
-    parts = urlsplit(url)
-    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+_bilibili_view_decoder = msgspec.json.Decoder(_BilibiliViewResponse)
 
 
 def _normalize_image_url(u: str) -> str:
@@ -41,75 +60,80 @@ def _extract_bilibili_video_id(url: str) -> Optional[Tuple[str, str]]:
       https://m.bilibili.com/video/BVxxxxxxx?p=2 (query ignored)
       .../video/av123456
     """
-    clean = _trim_url_keep_path(url)
-    path = urlsplit(clean).path
-    segments = [s for s in path.split("/") if s]
-
-    candidate = None
-    if len(segments) >= 2 and segments[0].lower() == "video":  # noqa: PLR2004
-        candidate = segments[1]
-    if candidate is None:
-        candidate = next(
-            (s for s in segments if s.startswith("BV") or s.lower().startswith("av")),
-            None,
-        )
-    if not candidate:
+    match = BILIBILI_VIDEO_ID_REGEX.search(urlsplit(url).path)
+    if not match:
         return None
+    bvid, aid = match.groups()
+    return ("bvid", bvid) if bvid else ("aid", aid)
 
-    if candidate.lower().startswith("av"):
-        num = candidate[2:]
-        return ("aid", num) if num.isdigit() else None
 
-    if candidate.startswith("BV"):
-        return ("bvid", candidate)
+class ThumbnailProvider[C](ABC):
+    """Abstract thumbnail provider.
 
-    return None
-
-
-class ThumbnailProvider(ABC):
-    """Abstract thumbnail provider."""
+    `probe` inspects a URL once and returns provider-specific context, which is
+    handed back to `get_thumbnail` so the URL does not have to be parsed twice.
+    """
 
     @abstractmethod
-    def matches(self, url: str) -> bool:
-        """Return True if this provider can handle the URL."""
+    def probe(self, url: str) -> Optional[C]:
+        """Return parsing context if this provider can handle the URL, otherwise None."""
         raise NotImplementedError
 
     @abstractmethod
-    async def get_thumbnail(self, url: str) -> Optional[str]:
+    async def get_thumbnail(self, url: str, ctx: C) -> Optional[str]:
         """Return a direct thumbnail URL or None if not resolvable."""
         raise NotImplementedError
 
 
-class YouTubeProvider(ThumbnailProvider):
+class YouTubeProvider(ThumbnailProvider[str]):
     """YouTube: extract the video ID and return img.youtube.com maxres thumbnail."""
 
+    # The two URL shapes nearly every chat link uses; anything else goes through the full regex.
+    _FAST_PREFIXES = tuple(
+        f"{scheme}{host}"
+        for scheme in ("https://", "http://", "")
+        for host in ("youtu.be/", "www.youtube.com/watch?v=", "youtube.com/watch?v=", "m.youtube.com/watch?v=")
+    )
+
     def __init__(self) -> None:
         """Initialize YouTubeProvider."""
         self._regex = YOUTUBE_URL_REGEX
 
-    def matches(self, url: str) -> bool:
-        """Match a URL."""
-        return bool(self._regex.match(url))
+    def _fast_video_id(self, lowered: str, url: str) -> Optional[str]:
+        prefix = next((p for p in self._FAST_PREFIXES if lowered.startswith(p)), None)
+        if prefix is None:
+            return None
+        rest = url[len(prefix) :]
+        end = min((i for i in map(rest.find, "?&#/") if i >= 0), default=len(rest))
+        vid = rest[:end]
+        if 10 <= len(vid) <= 20 and vid.replace("-", "").replace("_", "").isalnum():  # noqa: PLR2004
+            return vid
+        return None
 
-    @staticmethod
-    def _extract_video_id(url: str) -> Optional[str]:
-        match = YOUTUBE_URL_REGEX.match(url)
+    def probe(self, url: str) -> Optional[str]:
+        """Match a URL and return its video ID."""
+        lowered = url.lower()
+        # Every branch of the pattern contains "youtu", so skip the full alternation for other hosts.
+        if "youtu" not in lowered:
+            return None
+        vid = self._fast_video_id(lowered, url)
+        if vid:
+            return vid
+        match = self._regex.match(url)
         if not match:
             return None
         return match.group("video_id_1") or match.group("video_id_2") or match.group("video_id_3")
 
-    async def get_thumbnail(self, url: str) -> Optional[str]:
+    async def get_thumbnail(self, url: str, ctx: str) -> Optional[str]:
         """Get the thumbnail URL."""
-        vid = self._extract_video_id(url)
-        if not vid:
-            return None
-        return f"https://img.youtube.com/vi/{vid}/maxresdefault.jpg"
+        return f"https://img.youtube.com/vi/{ctx}/maxresdefault.jpg"
 
 
-class BilibiliProvider(ThumbnailProvider):
+class BilibiliProvider(ThumbnailProvider[str]):
     """Bilibili: resolve b23 shortlinks, extract BV/av, call view API and return data.pic."""
 
     _API_URL = URL("https://api.bilibili.com/x/web-interface/view")
+    _HOSTS = ("bilibili.com", "b23.tv")
 
     def __init__(
         self,
@@ -119,37 +143,52 @@ class BilibiliProvider(ThumbnailProvider):
         """Initialize the BilibiliProvider."""
         self._session = session
         self._timeout = timeout
-
-    def matches(self, url: str) -> bool:
-        """Match the URL."""
-        host = urlsplit(url).netloc.lower()
-        return "bilibili.com" in host or "b23.tv" in host
+        self._short_url_cache: TTLCache[str, str] = TTLCache(BILIBILI_CACHE_SIZE, BILIBILI_CACHE_TTL)
+        self._pic_cache: TTLCache[tuple[str, str], str] = TTLCache(BILIBILI_CACHE_SIZE, BILIBILI_CACHE_TTL)
+
+    def probe(self, url: str) -> Optional[str]:
+        """Match the URL and return its lowercased host."""
+        # Slice the host out directly instead of parsing the whole URL.
+        start = url.find("://")
+        start = start + 3 if start >= 0 else 0
+        end = url.find("/", start)
+        host = url[start : end if end >= 0 else None].partition(":")[0].lower()
+        return host if host.endswith(self._HOSTS) else None
 
     async def _resolve_short_url(self, url: str) -> str:
-        """Follow redirects for b23.tv (HEAD then GET fallback)."""
+        """Follow redirects for b23.tv with a single GET.
+
+        Only the final URL is needed, so the response body is never read.
+        """
         timeout = aiohttp.ClientTimeout(total=self._timeout)
-        try:
-            async with self._session.head(url, allow_redirects=True, timeout=timeout) as r:
-                return str(r.url) if r.url else url
-        except Exception:
-            pass
         try:
             async with self._session.get(url, allow_redirects=True, timeout=timeout) as r:
                 return str(r.url) if r.url else url
         except Exception:
             return url
 
-    async def get_thumbnail(self, url: str) -> Optional[str]:
+    async def get_thumbnail(self, url: str, ctx: str) -> Optional[str]:
         """Get the thumbnail URL."""
-        parts = urlsplit(url)
-        if "b23.tv" in parts.netloc.lower():
-            url = await self._resolve_short_url(url)
+        if ctx.endswith("b23.tv"):
+            resolved = self._short_url_cache.get(url)
+            if resolved is None:
+                resolved = await self._resolve_short_url(url)
+                if resolved != url:
+                    self._short_url_cache.set(url, resolved)
+            url = resolved
 
         idinfo = _extract_bilibili_video_id(url)
         if not idinfo:
             return None
-
-        id_type, id_value = idinfo
+        pic = self._pic_cache.get(idinfo)
+        if pic is None:
+            pic = await self._fetch_pic(*idinfo)
+            if pic is not None:
+                self._pic_cache.set(idinfo, pic)
+        return pic
+
+    async def _fetch_pic(self, id_type: str, id_value: str) -> Optional[str]:
+        """Look up a video's cover image through the Bilibili view API."""
         params = {id_type: id_value}
         timeout = aiohttp.ClientTimeout(total=self._timeout)
         headers = {
@@ -162,28 +201,23 @@ class BilibiliProvider(ThumbnailProvider):
             async with self._session.get(self._API_URL, params=params, headers=headers, timeout=timeout) as resp:
                 if resp.status != 200:  # noqa: PLR2004
                     return None
-                payload = await resp.json(content_type=None)
+                payload = _bilibili_view_decoder.decode(await resp.read())
         except Exception:
             return None
 
-        if not isinstance(payload, dict) or payload.get("code") != 0:
-            return None
-
-        data = payload.get("data") or {}
-        pic = data.get("pic")
-        if not isinstance(pic, str) or not pic:
+        if payload.code != 0 or payload.data is None or not payload.data.pic:
             return None
-        return _normalize_image_url(pic)
+        return _normalize_image_url(payload.data.pic)
 
 
 class VideoThumbnailService:
-    _providers: Sequence[ThumbnailProvider]
+    _providers: Sequence[ThumbnailProvider[Any]]
 
     def __init__(
         self,
         session: aiohttp.ClientSession,
         *,
-        providers: Optional[Sequence[ThumbnailProvider]] = [],
+        providers: Optional[Sequence[ThumbnailProvider[Any]]] = [],
         fallback: Optional[str] = None,
     ) -> None:
         """Initialize the VideoThumbnailService."""
@@ -193,19 +227,44 @@ class VideoThumbnailService:
             BilibiliProvider(session=self._session),
         ]
         self._fallback = fallback
+        self._inflight: dict[str, asyncio.Task[str]] = {}
 
     async def get_thumbnail(self, url: str) -> str:
         """Return a direct thumbnail URL if resolved; otherwise fallback or original URL.
 
+        Concurrent calls for the same URL share a single lookup.
+
         Args:
             url: The input video/page URL.
         """
-        for p in self._providers:
-            if p.matches(url):
-                thumb = await p.get_thumbnail(url)
-                if thumb:
-                    return thumb
-        return self._fallback if self._fallback is not None else url
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._resolve_thumbnail(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # Shield so one caller being cancelled does not cancel the lookup for the others.
+        return await asyncio.shield(task)
+
+    async def _resolve_thumbnail(self, url: str) -> str:
+        fallback = self._fallback if self._fallback is not None else url
+        matched = [(p, ctx) for p in self._providers if (ctx := p.probe(url)) is not None]
+        if len(matched) == 1:
+            p, ctx = matched[0]
+            return await p.get_thumbnail(url, ctx) or fallback
+
+        # Several providers claim the URL: query them concurrently and keep the first thumbnail found.
+        pending = {asyncio.create_task(p.get_thumbnail(url, ctx)) for p, ctx in matched}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    thumb = task.result()
+                    if thumb:
+                        return thumb
+        finally:
+            for task in pending:
+                task.cancel()
+        return fallback
 
 
 async def setup(bot: Genji) -> None:
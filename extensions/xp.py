@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from logging import getLogger
 from math import floor
 from typing import TYPE_CHECKING
 
 from aio_pika.abc import AbstractIncomingMessage
-from discord import TextChannel, app_commands, utils
+from discord import TextChannel, app_commands
 from discord.ext import commands
 from genjipk_sdk.users import Notification
 from genjipk_sdk.xp import XP_AMOUNTS, XP_TYPES, XpGrantEvent, XpGrantRequest
@@ -15,80 +17,183 @@ from utilities import transformers
 from utilities.base import BaseService
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable
+
+    from discord import Role
+
     import core
     from utilities._types import GenjiItx
 
 log = getLogger(__name__)
 
+PRESTIGE_KEY_REWARD = 15
+XP_MULTIPLIER_CACHE_TTL = 30.0
+XP_GRANT_PREFETCH = 32
+
 
 # TODO: Make alerts into cv2, pretty
 class XPService(BaseService):
     xp_channel: TextChannel
 
+    _XP_GAIN_TEMPLATE = "<:_:976917981009440798> {name} has gained **{amount} XP** ({type})!"
+    _RANK_UP_DM_TEMPLATE = (
+        "Congratulations! You have ranked up to **{new_rank}**!\n"
+        "[Log into the website to open your lootbox!](https://genji.pk/lootbox)"
+    )
+    _RANK_UP_TEMPLATE = "<:_:976468395505614858> {name} has ranked up! **{old_rank}** -> **{new_rank}**\n"
+    _PRESTIGE_DM_TEMPLATE = (
+        "Congratulations! You have prestiged up to **{new_level}**!\n"
+        "[Log into the website to open your {keys} lootboxes!](https://genji.pk/lootbox)"
+    )
+    _PRESTIGE_TEMPLATE = (
+        "<:_:976468395505614858><:_:976468395505614858><:_:976468395505614858> "
+        "{name} has prestiged! **Prestige {old_level}** -> **Prestige {new_level}**"
+    )
+
+    def __init__(self, bot: core.Genji) -> None:
+        """Initialize XPService."""
+        self._role_by_name: dict[str, Role] = {}
+        self._multiplier_cache: tuple[float, float] | None = None
+        super().__init__(bot)
+
     async def _resolve_channels(self) -> None:
         """Resolve and cache channels used by the XP system.
 
         Asserts that the configured XP channel exists and stores it on the
-        instance for later use.
+        instance for later use. Also builds the role-by-name lookup used for
+        rank and prestige role swaps.
         """
         xp_channel = self.bot.get_channel(self.bot.config.channels.updates.xp)
         assert isinstance(xp_channel, TextChannel)
         self.xp_channel = xp_channel
+        self._role_by_name = {role.name: role for role in self.guild.roles}
 
-    async def _update_xp_prestige_roles_for_user(
-        self, user_id: int, old_prestige_level: int, new_prestige_level: int
-    ) -> None:
-        """Update a member's prestige role to reflect a prestige level change.
+    async def _get_multiplier(self) -> float:
+        """Return the current XP multiplier, refreshing it from the API at most once per TTL window.
+
+        Returns:
+            float: The current XP multiplier.
+        """
+        now = time.monotonic()
+        if self._multiplier_cache and self._multiplier_cache[1] > now:
+            return self._multiplier_cache[0]
+        multiplier = await self.bot.api.get_xp_multiplier()
+        self._multiplier_cache = (multiplier, now + XP_MULTIPLIER_CACHE_TTL)
+        return multiplier
+
+    def cache_role(self, role: Role, *, previous_name: str | None = None) -> None:
+        """Add or refresh a role in the role-by-name lookup.
+
+        Args:
+            role (Role): The created or updated role.
+            previous_name (str | None): The role's name before an update, if it changed.
+        """
+        if role.guild.id != self.bot.config.guild:
+            return
+        if previous_name is not None and previous_name != role.name:
+            cached = self._role_by_name.get(previous_name)
+            if cached and cached.id == role.id:
+                del self._role_by_name[previous_name]
+        self._role_by_name[role.name] = role
+
+    def uncache_role(self, role: Role) -> None:
+        """Remove a deleted role from the role-by-name lookup.
+
+        Args:
+            role (Role): The deleted role.
+        """
+        if role.guild.id != self.bot.config.guild:
+            return
+        cached = self._role_by_name.get(role.name)
+        if cached and cached.id == role.id:
+            del self._role_by_name[role.name]
+
+    def _get_prestige_roles(self, old_prestige_level: int, new_prestige_level: int) -> tuple[Role, Role]:
+        """Look up the prestige roles for a prestige level change.
 
         Args:
-            user_id (int): ID of the member to update.
             old_prestige_level (int): Previously held prestige level.
             new_prestige_level (int): Newly achieved prestige level.
 
+        Returns:
+            tuple[Role, Role]: The old and new prestige roles.
+
         Raises:
             ValueError: If the prestige roles cannot be found.
         """
-        old_prestige_role = utils.get(self.guild.roles, name=f"Prestige {old_prestige_level}")
-        new_prestige_role = utils.get(self.guild.roles, name=f"Prestige {new_prestige_level}")
-        if not (old_prestige_role or new_prestige_role):
-            log.debug(
-                f"Old prestige level: {old_prestige_level}\n"
-                f"New prestige level: {new_prestige_level}\nUser ID: {user_id}"
-            )
+        old_prestige_role = self._role_by_name.get(f"Prestige {old_prestige_level}")
+        new_prestige_role = self._role_by_name.get(f"Prestige {new_prestige_level}")
+        if not (old_prestige_role and new_prestige_role):
+            log.debug(f"Old prestige level: {old_prestige_level}\nNew prestige level: {new_prestige_level}")
             raise ValueError("Can't update xp prestige roles for user.")
-        assert old_prestige_role and new_prestige_role
-        member = self.guild.get_member(user_id)
-        if not member:
-            return
-        roles = set(member.roles)
-        roles.discard(old_prestige_role)
-        roles.add(new_prestige_role)
-        await member.edit(roles=list(roles))
+        return old_prestige_role, new_prestige_role
 
-    async def _update_xp_roles_for_user(self, user_id: int, old_tier_name: str, new_tier_name: str) -> None:
-        """Update a member's rank role to reflect a tier change.
+    def _get_rank_roles(self, old_tier_name: str, new_tier_name: str) -> tuple[Role, Role]:
+        """Look up the rank roles for a tier change.
 
         Args:
-            user_id (int): ID of the member to update.
             old_tier_name (str): Name of the previous main tier role.
             new_tier_name (str): Name of the new main tier role.
 
+        Returns:
+            tuple[Role, Role]: The old and new rank roles.
+
         Raises:
             ValueError: If the rank roles cannot be found.
         """
-        old_rank = utils.get(self.guild.roles, name=old_tier_name)
-        new_rank = utils.get(self.guild.roles, name=new_tier_name)
-        if not (old_rank or new_rank):
-            log.debug(f"Old tier name: {old_tier_name}\nNew tier name: {new_tier_name}\nUser ID: {user_id}")
+        old_rank = self._role_by_name.get(old_tier_name)
+        new_rank = self._role_by_name.get(new_tier_name)
+        if not (old_rank and new_rank):
+            log.debug(f"Old tier name: {old_tier_name}\nNew tier name: {new_tier_name}")
             raise ValueError("Can't update xp roles for user.")
-        assert old_rank and new_rank
+        return old_rank, new_rank
+
+    async def _apply_role_diff(self, user_id: int, remove: Iterable[Role], add: Iterable[Role]) -> None:
+        """Swap a member's roles in a single edit request.
+
+        Sends the role ID list straight through the HTTP client rather than ``Member.edit``;
+        the member cache is refreshed by the resulting gateway member update.
+
+        Args:
+            user_id (int): ID of the member to update.
+            remove (Iterable[Role]): Roles to take away from the member.
+            add (Iterable[Role]): Roles to give to the member.
+        """
         member = self.guild.get_member(user_id)
         if not member:
             return
-        roles = set(member.roles)
-        roles.discard(old_rank)
-        roles.add(new_rank)
-        await member.edit(roles=list(roles))
+        removed = {role.id for role in remove}
+        role_ids = [role.id for role in member.roles if role.id not in removed and not role.is_default()]
+        role_ids.extend(role.id for role in add if role.id not in role_ids)
+        await self.bot.http.edit_member(self.guild.id, user_id, roles=role_ids)
+
+    async def _grant_keys(self, user_id: int, count: int) -> None:
+        """Grant a number of active lootbox keys to a user as one unit.
+
+        Key grants cannot be deduplicated by the API, so a redelivered event would grant them again.
+        The error is only raised when no key was granted; a partial failure is logged with the
+        number of missing keys instead of failing the event.
+
+        Args:
+            user_id (int): ID of the user receiving the keys.
+            count (int): Number of keys to grant.
+
+        Raises:
+            Exception: The first grant error, if every grant failed.
+        """
+        if not count:
+            return
+        results = await asyncio.gather(
+            *(self.bot.api.grant_active_key_to_user(user_id) for _ in range(count)), return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if len(failures) == count:
+            raise failures[0]
+        if failures:
+            log.error(
+                f"Granted {count - len(failures)} of {count} lootbox keys to user {user_id}",
+                exc_info=failures[0],
+            )
 
     async def grant_user_xp_of_type(self, user_id: int, xp_type: XP_TYPES) -> None:
         """Grant XP of a specific type to a user and emit notifications.
@@ -103,79 +208,94 @@ class XPService(BaseService):
         data = XpGrantRequest(XP_AMOUNTS[xp_type], xp_type)
         await self.bot.api.grant_user_xp(user_id, data)
 
-    @queue_consumer("api.xp.grant", struct_type=XpGrantEvent, idempotent=True)
+    @queue_consumer("api.xp.grant", struct_type=XpGrantEvent, idempotent=True, prefetch_count=XP_GRANT_PREFETCH)
     async def _process_xp_grant(self, event: XpGrantEvent, _: AbstractIncomingMessage) -> None:
+        if event.amount == 0 and event.previous_amount == event.new_amount:
+            log.debug(f"[x] [RabbitMQ] Ignoring zero XP grant event: {event.user_id}")
+            return
         log.debug(f"[x] [RabbitMQ] Processing XP grant event: {event.user_id}")
+        await self._process_xp_notification(event)
+
+    async def _process_xp_notification(self, event: XpGrantEvent) -> None:
+        """Announce an XP gain and apply any resulting rank or prestige changes.
+
+        Args:
+            event (XpGrantEvent): The XP grant event.
+        """
         user = self.guild.get_member(event.user_id)
         if not user:
             return
 
-        multiplier = await self.bot.api.get_xp_multiplier()
+        multiplier, xp_data = await asyncio.gather(
+            self._get_multiplier(),
+            self.bot.api.get_xp_tier_change(event.previous_amount, event.new_amount),
+        )
         amount = floor(event.amount * multiplier)
 
         await self.bot.notifications.notify_channel_default_to_no_ping(
             self.xp_channel,
             event.user_id,
             Notification.PING_ON_XP_GAIN,
-            f"<:_:976917981009440798> {user.display_name} has gained **{amount} XP** ({event.type})!",
+            self._XP_GAIN_TEMPLATE.format(name=user.display_name, amount=amount, type=event.type),
         )
 
-        xp_data = await self.bot.api.get_xp_tier_change(event.previous_amount, event.new_amount)
-
-        if xp_data.rank_change_type:
-            old_rank = " ".join((xp_data.old_main_tier_name, xp_data.old_sub_tier_name))
-            new_rank = " ".join((xp_data.new_main_tier_name, xp_data.new_sub_tier_name))
-
-            await self.bot.api.grant_active_key_to_user(event.user_id)
-            await self._update_xp_roles_for_user(event.user_id, xp_data.old_main_tier_name, xp_data.new_main_tier_name)
-
-            await self.bot.notifications.notify_dm(
-                event.user_id,
-                Notification.DM_ON_LOOTBOX_GAIN,
-                (
-                    f"Congratulations! You have ranked up to **{new_rank}**!\n"
-                    "[Log into the website to open your lootbox!](https://genji.pk/lootbox)"
-                ),
-            )
-
-            await self.bot.notifications.notify_channel_default_to_no_ping(
-                self.xp_channel,
-                event.user_id,
-                Notification.PING_ON_COMMUNITY_RANK_UPDATE,
-                f"<:_:976468395505614858> {user.display_name} has ranked up! **{old_rank}** -> **{new_rank}**\n",
-            )
+        if not (xp_data.rank_change_type or xp_data.prestige_change):
+            return
 
+        # Resolve every role before granting anything so a missing role fails the event without side effects,
+        # and swap the rank and prestige roles together in one member edit.
+        old_rank_role, new_rank_role = self._get_rank_roles(xp_data.old_main_tier_name, xp_data.new_main_tier_name)
+        remove, add = [old_rank_role], [new_rank_role]
         if xp_data.prestige_change:
-            for __ in range(15):
-                await self.bot.api.grant_active_key_to_user(event.user_id)
-
-            old_rank = " ".join((xp_data.old_main_tier_name, xp_data.old_sub_tier_name))
-            new_rank = " ".join((xp_data.new_main_tier_name, xp_data.new_sub_tier_name))
-
-            await self._update_xp_roles_for_user(event.user_id, xp_data.old_main_tier_name, xp_data.new_main_tier_name)
-            await self._update_xp_prestige_roles_for_user(
-                event.user_id, xp_data.old_prestige_level, xp_data.new_prestige_level
+            old_prestige_role, new_prestige_role = self._get_prestige_roles(
+                xp_data.old_prestige_level, xp_data.new_prestige_level
             )
+            remove.append(old_prestige_role)
+            add.append(new_prestige_role)
+        await self._apply_role_diff(event.user_id, remove, add)
+
+        keys = (1 if xp_data.rank_change_type else 0) + (PRESTIGE_KEY_REWARD if xp_data.prestige_change else 0)
+        await self._grant_keys(event.user_id, keys)
 
-            await self.bot.notifications.notify_dm(
-                event.user_id,
-                Notification.DM_ON_LOOTBOX_GAIN,
-                (
-                    f"Congratulations! You have prestiged up to **{xp_data.new_prestige_level}**!\n"
-                    "[Log into the website to open your 15 lootboxes!](https://genji.pk/lootbox)"
+        # Keys are granted by now, so a failed notice must not fail the event and get it redelivered.
+        notices: list[Awaitable[object]] = []
+        if xp_data.rank_change_type:
+            old_rank = f"{xp_data.old_main_tier_name} {xp_data.old_sub_tier_name}"
+            new_rank = f"{xp_data.new_main_tier_name} {xp_data.new_sub_tier_name}"
+            notices += (
+                self.bot.notifications.notify_dm(
+                    event.user_id,
+                    Notification.DM_ON_LOOTBOX_GAIN,
+                    self._RANK_UP_DM_TEMPLATE.format(new_rank=new_rank),
+                ),
+                self.bot.notifications.notify_channel_default_to_no_ping(
+                    self.xp_channel,
+                    event.user_id,
+                    Notification.PING_ON_COMMUNITY_RANK_UPDATE,
+                    self._RANK_UP_TEMPLATE.format(name=user.display_name, old_rank=old_rank, new_rank=new_rank),
                 ),
             )
-
-            await self.bot.notifications.notify_channel_default_to_no_ping(
-                self.xp_channel,
-                event.user_id,
-                Notification.PING_ON_COMMUNITY_RANK_UPDATE,
-                (
-                    f"<:_:976468395505614858><:_:976468395505614858><:_:976468395505614858> "
-                    f"{user.display_name} has prestiged! "
-                    f"**Prestige {xp_data.old_prestige_level}** -> **Prestige {xp_data.new_prestige_level}**"
+        if xp_data.prestige_change:
+            notices += (
+                self.bot.notifications.notify_dm(
+                    event.user_id,
+                    Notification.DM_ON_LOOTBOX_GAIN,
+                    self._PRESTIGE_DM_TEMPLATE.format(new_level=xp_data.new_prestige_level, keys=PRESTIGE_KEY_REWARD),
+                ),
+                self.bot.notifications.notify_channel_default_to_no_ping(
+                    self.xp_channel,
+                    event.user_id,
+                    Notification.PING_ON_COMMUNITY_RANK_UPDATE,
+                    self._PRESTIGE_TEMPLATE.format(
+                        name=user.display_name,
+                        old_level=xp_data.old_prestige_level,
+                        new_level=xp_data.new_prestige_level,
+                    ),
                 ),
             )
+        for result in await asyncio.gather(*notices, return_exceptions=True):
+            if isinstance(result, BaseException):
+                log.warning(f"Failed to send rank notice for user {event.user_id}", exc_info=result)
 
 
 class XPCog(commands.GroupCog, group_name="xp"):
@@ -183,6 +303,21 @@ class XPCog(commands.GroupCog, group_name="xp"):
         """Initialize XPCog."""
         self.bot = bot
 
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: Role) -> None:
+        """Keep the XP role lookup in sync with newly created roles."""
+        self.bot.xp.cache_role(role)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: Role, after: Role) -> None:
+        """Keep the XP role lookup in sync with renamed or edited roles."""
+        self.bot.xp.cache_role(after, previous_name=before.name)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: Role) -> None:
+        """Keep the XP role lookup in sync with deleted roles."""
+        self.bot.xp.uncache_role(role)
+
     @app_commands.command(name="grant")
     async def _command_grant_xp(
         self,
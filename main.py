@@ -1,17 +1,20 @@
-# ruff: noqa: E402
-import sentry_sdk
-import truststore
-from sentry_sdk.integrations.asyncio import AsyncioIntegration
+import os
+
+# The OS trust store must be injected before anything builds an SSL context; deployments that ship
+# their own CA bundle can opt out with USE_TRUSTSTORE=0 and skip loading it on every start.
+if os.getenv("USE_TRUSTSTORE", "1") == "1":
+    import truststore
 
-truststore.inject_into_ssl()
+    truststore.inject_into_ssl()
 import asyncio
 import contextlib
 import logging
-import os
 from typing import Iterator
 
 import aiohttp
 import discord
+import sentry_sdk
+from sentry_sdk.integrations.asyncio import AsyncioIntegration
 
 import core
 from utilities.errors import on_command_error
@@ -68,23 +71,28 @@ def setup_logging() -> Iterator[None]:
 
 async def main() -> None:
     """Start the bot instance."""
-    sentry_sdk.init(
-        dsn=SENTRY_DSN,
-        send_default_pii=True,
-        enable_logs=True,
-        traces_sample_rate=1.0,
-        profile_session_sample_rate=1.0,
-        profile_lifecycle="trace",
-        environment=BOT_ENVIRONMENT,
-        integrations=[
-            AsyncioIntegration(),
-        ],
-        debug=BOT_ENVIRONMENT != "production",
-    )
+    if SENTRY_DSN:
+        sentry_sdk.init(
+            dsn=SENTRY_DSN,
+            send_default_pii=True,
+            enable_logs=True,
+            traces_sample_rate=1.0,
+            profile_session_sample_rate=1.0,
+            profile_lifecycle="trace",
+            environment=BOT_ENVIRONMENT,
+            integrations=[
+                AsyncioIntegration(),
+            ],
+            debug=BOT_ENVIRONMENT != "production",
+        )
 
     logging.getLogger("discord.gateway").setLevel("WARNING")
     prefix = "?" if BOT_ENVIRONMENT == "production" else "!"
-    async with aiohttp.ClientSession() as http_session:
+    # Shared by outbound lookups such as video thumbnails; keep connections and DNS answers warm between calls.
+    connector = aiohttp.TCPConnector(limit=128, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=60)
+    # Bound connect and per-read stalls only, so long transfers are not cut off by an overall deadline.
+    timeout = aiohttp.ClientTimeout(sock_connect=10, sock_read=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http_session:
         bot = core.Genji(prefix=prefix, session=http_session)
 
         async with bot:
@@ -142,10 +142,15 @@ class ConfirmationView(BaseView):
         self.confirm_callback: Callable[[], None] | Callable[[], Awaitable[None]] | None = callback
         self.confirmed: bool | None = None
         self.image_url: str | None = image_url
+        self._last_built_state: tuple[str, str | None, str] | None = None
         super().__init__()
 
     def rebuild_components(self) -> None:
-        """Rebuild the confirmation view components."""
+        """Rebuild the confirmation view components, skipping the rebuild if nothing changed."""
+        state = (self.message, self.image_url, self._end_time_string)
+        if state == self._last_built_state:
+            return
+        self._last_built_state = state
         self.clear_items()
         container = ui.Container(
             ui.TextDisplay(self.message),
@@ -184,30 +189,32 @@ class BaseService:
             bot (core.Genji): The bot instance used for Discord access and API communication.
         """
         self.bot = bot
-        self._ensure_guild_and_channel_lock = asyncio.Lock()
-        self._set_attrs_task = asyncio.create_task(self._ensure_guild_and_channel())
+        self._set_attrs_task = asyncio.create_task(self._set_guild_and_channel())
 
-    async def _ensure_guild_and_channel(self) -> None:
-        """Ensure the shared Discord guild and service channels are initialized.
+    async def _set_guild_and_channel(self) -> None:
+        """Initialize the shared Discord guild and service channels once the bot is ready.
 
         Raises:
             AssertionError: If the configured guild cannot be retrieved.
         """
-        if self._guild_and_channel_set:
-            return
-
         await self.bot.wait_until_ready()
 
-        async with self._ensure_guild_and_channel_lock:
-            if self._guild_and_channel_set:
-                return
+        guild = self.bot.get_guild(self.bot.config.guild)
+        assert guild is not None
+        self.guild = guild
 
-            guild = self.bot.get_guild(self.bot.config.guild)
-            assert guild is not None
-            self.guild = guild
+        await self._resolve_channels()
+        self._guild_and_channel_set = True
 
-            await self._resolve_channels()
-            self._guild_and_channel_set = True
+    async def _ensure_guild_and_channel(self) -> None:
+        """Wait until the shared Discord guild and service channels are initialized.
+
+        Raises:
+            AssertionError: If the configured guild cannot be retrieved.
+        """
+        if self._guild_and_channel_set:
+            return
+        await self._set_attrs_task
 
     async def _resolve_channels(self) -> None:
         """Resolves service-specific Discord channels.
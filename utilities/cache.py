@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+
+class TTLCache[K, V]:
+    """A bounded in-memory mapping whose entries expire after `ttl` seconds.
+
+    Once `maxsize` entries are held, the least recently used one is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Seconds an entry stays valid after it is set.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for `key`, or None if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store `value` under `key`, evicting the least recently used entry if the cache is full."""
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Drop `key` from the cache if present."""
+        self._data.pop(key, None)
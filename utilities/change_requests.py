@@ -1,9 +1,15 @@
 from typing import Any
 
-from genjipk_sdk.change_requests import ChangeRequestResponse
+from genjipk_sdk.change_requests import ChangeRequestResponse, ChangeRequestType
 
 
-class FormattableChangeRequest(ChangeRequestResponse):
+class _FormattableChangeRequestMixin:
+    __slots__ = ()
+
+    code: str
+    content: str
+    change_request_type: ChangeRequestType
+
     def to_format_dict(self) -> dict[str, Any]:
         """Convert the struct to a dictionary for rendering.
 
@@ -17,15 +23,7 @@ class FormattableChangeRequest(ChangeRequestResponse):
         }
 
 
-class FormattableStaleChangeRequest(ChangeRequestResponse):
-    def to_format_dict(self) -> dict[str, Any]:
-        """Convert the struct to a dictionary for rendering.
+class FormattableChangeRequest(_FormattableChangeRequestMixin, ChangeRequestResponse): ...
 
-        Returns:
-            dict[str, str | None]: Mapping of field names to values.
-        """
-        return {
-            "Code": self.code,
-            "Type": self.change_request_type,
-            "Request": self.content,
-        }
+
+class FormattableStaleChangeRequest(_FormattableChangeRequestMixin, ChangeRequestResponse): ...
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from logging import getLogger
 
 from genjipk_sdk.completions import CompletionCreateRequest, CompletionSubmissionResponse, SuspiciousCompletionResponse
@@ -73,18 +74,9 @@ class CompletionCreateModel(CompletionCreateRequest):
         return description
 
 
-_MEDAL_TO_VERIFIED = {
-    "full": VERIFIED_FULL,
-    "gold": VERIFIED_GOLD,
-    "silver": VERIFIED_SILVER,
-    "bronze": VERIFIED_BRONZE,
-}
-_MEDAL_TO_WR = {
-    "full": WR_FULL,
-    "gold": WR_GOLD,
-    "silver": WR_SILVER,
-    "bronze": WR_BRONZE,
-}
+_MEDAL_INDEX = {"full": 0, "gold": 1, "silver": 2, "bronze": 3}
+_VERIFIED_ICONS = (VERIFIED_FULL, VERIFIED_GOLD, VERIFIED_SILVER, VERIFIED_BRONZE)
+_WR_ICONS = (WR_FULL, WR_GOLD, WR_SILVER, WR_BRONZE)
 
 
 def get_completion_icon_emoji(rank: int | None, medal: MedalType | None) -> str:
@@ -109,30 +101,38 @@ def get_completion_icon_emoji(rank: int | None, medal: MedalType | None) -> str:
     if rank is None:
         return VERIFIED_COMPLETION
 
-    key = "full" if medal is None else str(medal).lower()
-    if key not in ("full", "gold", "silver", "bronze"):
+    index = _MEDAL_INDEX.get("full" if medal is None else medal.lower())
+    if index is None:
         raise ValueError(f"Unknown medal type: {medal!r}")
 
-    if rank == 1:
-        return _MEDAL_TO_WR[key]
-
-    return _MEDAL_TO_VERIFIED[key]
+    return (_WR_ICONS if rank == 1 else _VERIFIED_ICONS)[index]
 
 
 def get_completion_icon_url(completion: bool, verified: bool, rank: int | None, medal: MedalType | None) -> str:
     """Return the applicable icon url for this completion submission."""
+    if completion:
+        return _completion_icon_url(True, verified, False, "full")
+    return _completion_icon_url(False, verified, rank == 1, medal.lower() if medal else "full")
+
+
+@lru_cache(maxsize=32)
+def _completion_icon_url(completion: bool, verified: bool, is_wr: bool, medal: str) -> str:
     base_url = "https://bkan0n.com/assets/images/genji/verification"
     if completion:
         prefix = "verified" if verified else "pending"
         return f"{base_url}/{prefix}_completion.avif"
 
-    _medal = medal.lower() if medal else "full"
-
-    if verified and rank == 1:
-        return f"{base_url}/wr_{_medal}.avif"
+    if verified and is_wr:
+        return f"{base_url}/wr_{medal}.avif"
 
     prefix = "verified" if verified else "pending"
-    return f"{base_url}/{prefix}_{_medal}.avif"
+    return f"{base_url}/{prefix}_{medal}.avif"
+
+
+_ORDINAL_SUFFIXES = tuple(
+    "th" if 11 <= i <= 13 else ("th", "st", "nd", "rd", "th")[min(i % 10, 4)]  # noqa: PLR2004
+    for i in range(100)
+)
 
 
 def make_ordinal(n: int) -> str:
@@ -144,7 +144,4 @@ def make_ordinal(n: int) -> str:
     make_ordinal(213) => '213th'
     """
     n = int(n)
-    suffix = ["th", "st", "nd", "rd", "th"][min(n % 10, 4)]
-    if 11 <= (n % 100) <= 13:  # noqa: PLR2004
-        suffix = "th"
-    return str(n) + suffix
+    return f"{n}{_ORDINAL_SUFFIXES[n % 100]}"
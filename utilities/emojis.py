@@ -1,5 +1,5 @@
 import math
-from typing import Literal
+from typing import Literal, cast
 
 CONFIRM = "<:_:1052666519487795261>"
 UNVERIFIED = "<:_:1042541865821556746>"
@@ -29,30 +29,33 @@ WR_BRONZE = "<a:_:1406287874143551528>"
 REJECTED = "<a:_:1406287841771651232>"
 
 
+_PLACEMENTS: dict[int, str] = {
+    1: FIRST,
+    2: SECOND,
+    3: THIRD,
+}
+
+
 def placements() -> dict[Literal[1, 2, 3], str]:
     """Create a dictionary for easy access to placement emojis."""
-    return {
-        1: FIRST,
-        2: SECOND,
-        3: THIRD,
-    }
+    return cast("dict[Literal[1, 2, 3], str]", _PLACEMENTS.copy())
 
 
 def get_placement_emoji(placement: int) -> str:
     """Get the placement emoji."""
-    if placement not in (1, 2, 3):
-        return ""
-    return placements()[placement]
+    return _PLACEMENTS.get(placement, "")
+
+
+_STAR_STRINGS = tuple(STAR * filled + EMPTY_STAR * (6 - filled) for filled in range(7))
 
 
 def stars_rating_string(rating: float | None = None) -> str:
     """Create a star rating string."""
     if not rating:
         return "Unrated"
-    filled = math.ceil(rating) * STAR
-    return filled + ((6 - len(filled)) * EMPTY_STAR)
+    return _STAR_STRINGS[max(0, min(math.ceil(rating), 6))]
 
 
 def generate_all_star_rating_strings() -> list[str]:
     """Generate all possible star combinations."""
-    return [stars_rating_string(x) for x in range(1, 7)]
+    return list(_STAR_STRINGS[1:])